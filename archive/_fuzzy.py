@@ -0,0 +1,147 @@
+"""
+Bounded edit-distance scoring for the autocomplete helpers in smart_interface.
+
+Input is partial, so a name matches when the query appears in it verbatim
+("ers" finds 76ers) or is within the edit budget of how one of its words
+begins ("blaz" and "lakr" complete Trail Blazers and Lakers).
+
+The banded DP kernel is JIT-compiled with numba when it is installed. Without
+numba, distances come from a bit-parallel kernel on plain Python ints.
+"""
+
+import heapq
+from typing import List, Sequence, Tuple
+
+try:
+    import numpy as np
+    from numba import njit
+except ImportError:
+    np = None
+    njit = None
+
+EncodedName = Tuple[str, str, tuple]
+
+
+def _bounded_levenshtein(a, b, max_dist):
+    """Levenshtein distance from a to the closest prefix of b, capped at max_dist + 1"""
+    len_a = len(a)
+    len_b = len(b)
+    if len_a - len_b > max_dist:
+        return max_dist + 1
+
+    previous = [j for j in range(len_b + 1)]
+    current = [0] * (len_b + 1)
+    for i in range(1, len_a + 1):
+        current[0] = i
+        row_min = i
+        char_a = a[i - 1]
+        for j in range(1, len_b + 1):
+            cost = 0 if char_a == b[j - 1] else 1
+            value = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + cost)
+            current[j] = value
+            if value < row_min:
+                row_min = value
+        # Every later row is at least this row's minimum
+        if row_min > max_dist:
+            return max_dist + 1
+        previous, current = current, previous
+
+    # The rest of b is free: the user has not typed it yet
+    return min(min(previous), max_dist + 1)
+
+
+def _myers_pattern(text: str):
+    """Match bitmask for each character of text, used by _myers_distance"""
+    peq = {}
+    for i, char in enumerate(text):
+        peq[char] = peq.get(char, 0) | (1 << i)
+    return peq, len(text)
+
+
+def _myers_distance(pattern, text: str, max_dist: int) -> int:
+    """Bit-parallel (Myers/Hyyro) distance to the closest prefix of text, capped at max_dist + 1.
+
+    One column of the DP is packed into Python ints, so each character of
+    text costs a handful of integer operations whatever the pattern length.
+    """
+    peq, m = pattern
+    n = len(text)
+    if m - n > max_dist:
+        return max_dist + 1
+    if m == 0:
+        return 0
+
+    mask = (1 << m) - 1
+    last = 1 << (m - 1)
+    pv, mv, score = mask, 0, m
+    best = m
+    for j, char in enumerate(text, 1):
+        eq = peq.get(char, 0)
+        xv = eq | mv
+        xh = (((eq & pv) + pv) ^ pv) | eq
+        ph = mv | ~(xh | pv)
+        mh = pv & xh
+        if ph & last:
+            score += 1
+        elif mh & last:
+            score -= 1
+        if score < best:
+            best = score
+        # The score can drop by at most one per remaining character
+        elif best > max_dist and score - (n - j) > max_dist:
+            return max_dist + 1
+        ph = (ph << 1) | 1
+        mh <<= 1
+        pv = (mh | ~(xv | ph)) & mask
+        mv = ph & xv & mask
+
+    return min(best, max_dist + 1)
+
+
+if njit is not None:
+    _distance = njit(cache=True)(_bounded_levenshtein)
+
+    def _encode(text: str):
+        return np.frombuffer(text.encode("utf-8"), dtype=np.uint8)
+
+    def _prepare(query: str):
+        return _encode(query)
+
+    # Pay the compile cost at import rather than on the first keystroke
+    _distance(_encode("warm"), _encode("up"), 1)
+else:
+    # Without numba the bit-parallel kernel beats the cell-by-cell DP
+    _distance = _myers_distance
+
+    def _encode(text: str):
+        return text
+
+    def _prepare(query: str):
+        return _myers_pattern(query)
+
+
+def encode_names(names: Sequence[str]) -> Tuple[EncodedName, ...]:
+    """Pre-encode each name, from the start of each word on, for repeated scoring"""
+    encoded = []
+    for name in names:
+        name_lc = name.lower()
+        words = name_lc.split()
+        # "trail blazers" -> "trail blazers", "blazers": a query may begin any word
+        parts = [" ".join(words[i:]) for i in range(len(words))] or [name_lc]
+        encoded.append((name, name_lc, tuple(_encode(part) for part in parts)))
+    return tuple(encoded)
+
+
+def top_k(query: str, names: Sequence[EncodedName], k: int, max_dist: int) -> List[str]:
+    """Return up to k names within max_dist edits of the query, closest first"""
+    query_lc = query.lower()
+    needle = _prepare(query_lc)
+    scored = []
+    for order, (name, name_lc, parts) in enumerate(names):
+        if query_lc in name_lc:
+            best = 0
+        else:
+            best = min(_distance(needle, part, max_dist) for part in parts)
+        if best <= max_dist:
+            scored.append((best, order, name))
+    return [name for _, _, name in heapq.nsmallest(k, scored)]
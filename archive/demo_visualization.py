@@ -231,12 +231,12 @@ def demo_smart_interface():
             intent = SmartInterface.parse_query_intent(test_query)
             
             st.json({
-                "Query Type": intent["type"],
-                "Detected Players": intent["entities"]["players"],
-                "Detected Teams": intent["entities"]["teams"],
-                "Detected Stats": intent["entities"]["stats"],
-                "Is Comparison": intent["comparison"],
-                "Confidence": f"{intent['confidence']:.1%}"
+                "Query Type": intent.type,
+                "Detected Players": list(intent.players),
+                "Detected Teams": list(intent.teams),
+                "Detected Stats": list(intent.stats),
+                "Is Comparison": intent.comparison,
+                "Confidence": f"{intent.confidence:.1%}"
             })
             
             enhanced = QueryOptimizer.enhance_query(test_query)
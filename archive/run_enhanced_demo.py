@@ -7,18 +7,14 @@ Run this to see the enhanced interface with modern visualizations
 import subprocess
 import sys
 import os
+from importlib.util import find_spec
 from pathlib import Path
 
 def check_dependencies():
     """Check if required packages are installed"""
     required_packages = ['streamlit', 'plotly', 'pandas', 'numpy']
-    missing_packages = []
-    
-    for package in required_packages:
-        try:
-            __import__(package)
-        except ImportError:
-            missing_packages.append(package)
+    # find_spec only locates the package, so nothing is imported just to check
+    missing_packages = [p for p in required_packages if find_spec(p) is None]
     
     if missing_packages:
         print(f"❌ Missing packages: {', '.join(missing_packages)}")
@@ -9,6 +9,7 @@ with improved onboarding, personalization, and interactive features.
 import subprocess
 import sys
 import os
+from importlib.util import find_spec
 from pathlib import Path
 
 def check_requirements():
@@ -20,13 +21,11 @@ def check_requirements():
         "requests"
     ]
     
-    missing_packages = []
-    
-    for package in required_packages:
-        try:
-            __import__(package.replace("-", "_"))
-        except ImportError:
-            missing_packages.append(package)
+    # Locate each package without importing it; distribution names use "-"
+    missing_packages = [
+        package for package in required_packages
+        if find_spec(package.replace("-", "_")) is None
+    ]
     
     if missing_packages:
         print(f"❌ Missing required packages: {', '.join(missing_packages)}")
@@ -90,15 +89,23 @@ def main():
     print("Press Ctrl+C to stop the server")
     print("=" * 50)
     
+    streamlit_cmd = [
+        sys.executable, "-m", "streamlit", "run", 
+        "app_ux_improved.py",
+        "--server.port=8501",
+        "--server.address=localhost",
+        "--browser.gatherUsageStats=false"
+    ]
+    
+    if os.name != "nt":
+        # Become the Streamlit process: same PID, and Ctrl+C goes straight to it
+        sys.stdout.flush()
+        os.execvp(streamlit_cmd[0], streamlit_cmd)
+    
+    # Windows has no real exec, so run Streamlit as a child there
     try:
         # Launch Streamlit app
-        subprocess.run([
-            sys.executable, "-m", "streamlit", "run", 
-            "app_ux_improved.py",
-            "--server.port=8501",
-            "--server.address=localhost",
-            "--browser.gatherUsageStats=false"
-        ], check=True)
+        subprocess.run(streamlit_cmd, check=True)
     
     except KeyboardInterrupt:
         print("\n👋 Thanks for trying NBA Agent Pro Enhanced UX!")
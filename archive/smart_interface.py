@@ -1,73 +1,135 @@
-import streamlit as st
 import re
-from typing import List, Dict, Tuple
-from difflib import get_close_matches
+from functools import lru_cache
+from itertools import chain
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Tuple
 import json
 
+from _fuzzy import encode_names, top_k
+
+# Stat abbreviations expanded by QueryOptimizer.enhance_query
+_ABBREVIATIONS = {
+    "pts": "points",
+    "ast": "assists",
+    "reb": "rebounds",
+    "stl": "steals",
+    "blk": "blocks"
+}
+_ABBR_RE = re.compile(r'\b(' + '|'.join(map(re.escape, _ABBREVIATIONS)) + r')\b', re.IGNORECASE)
+_SEASONS = frozenset({"2024-25", "2023-24", "2022-23"})
+_STAT_WORDS = frozenset({"stats", "points", "assists", "rebounds"})
+_ENHANCE_TRIGGER_RE = re.compile('|'.join(map(re.escape, sorted(_SEASONS | _STAT_WORDS | {"compare"}))))
+# Stats that trigger stat-leader suggestions in generate_smart_suggestions
+_STAT_MENTION_SEARCH = re.compile(r'points|assists|rebounds').search
+
+# NBA player names for autocomplete (subset for demo)
+POPULAR_PLAYERS = (
+    "LeBron James", "Stephen Curry", "Giannis Antetokounmpo", "Luka Doncic",
+    "Jayson Tatum", "Kevin Durant", "Nikola Jokic", "Joel Embiid", 
+    "Damian Lillard", "Anthony Davis", "Kawhi Leonard", "Jimmy Butler",
+    "Paul George", "Devin Booker", "Trae Young", "Ja Morant",
+    "Zion Williamson", "Tyler Herro", "Bam Adebayo", "Scottie Barnes"
+)
+
+NBA_TEAMS = (
+    "Lakers", "Warriors", "Celtics", "Heat", "Nets", "76ers", "Bucks",
+    "Nuggets", "Suns", "Clippers", "Mavericks", "Grizzlies", "Pelicans",
+    "Trail Blazers", "Kings", "Timberwolves", "Thunder", "Rockets",
+    "Spurs", "Jazz", "Hawks", "Hornets", "Bulls", "Cavaliers",
+    "Pistons", "Pacers", "Magic", "Knicks", "Raptors", "Wizards"
+)
+
+STAT_TYPES = (
+    "points", "assists", "rebounds", "steals", "blocks", "field goal percentage",
+    "three point percentage", "free throw percentage", "minutes", "turnovers"
+)
+
+# Lowercased copies, parallel to the display names above
+_POPULAR_PLAYERS_LOWER = tuple(player.lower() for player in POPULAR_PLAYERS)
+_NBA_TEAMS_LOWER = tuple(team.lower() for team in NBA_TEAMS)
+
+# Suggestions served for an empty autocomplete input
+_SUGGESTION_LIMIT = 5
+_DEFAULT_PLAYER_SUGGESTIONS = POPULAR_PLAYERS[:_SUGGESTION_LIMIT]
+_DEFAULT_TEAM_SUGGESTIONS = NBA_TEAMS[:_SUGGESTION_LIMIT]
+
+_VOICE_COMMANDS = (
+    "Hey NBA Agent, what are LeBron's stats?",
+    "Show me Warriors next game",
+    "Compare Giannis and Embiid",
+    "Who's leading in scoring?"
+)
+
+class QueryIntent(NamedTuple):
+    """Intent and entities extracted from a user query"""
+    type: str = "general"
+    players: Tuple[str, ...] = ()
+    teams: Tuple[str, ...] = ()
+    stats: Tuple[str, ...] = ()
+    timeframe: Optional[str] = None
+    comparison: bool = False
+    confidence: float = 0.5
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the nested dict shape used by JSON consumers"""
+        return {
+            "type": self.type,
+            "entities": {
+                "players": list(self.players),
+                "teams": list(self.teams),
+                "stats": list(self.stats),
+                "timeframe": self.timeframe
+            },
+            "comparison": self.comparison,
+            "confidence": self.confidence
+        }
+
 class SmartInterface:
     """Smart interface features for enhanced user experience"""
     
-    # NBA player names for autocomplete (subset for demo)
-    POPULAR_PLAYERS = [
-        "LeBron James", "Stephen Curry", "Giannis Antetokounmpo", "Luka Doncic",
-        "Jayson Tatum", "Kevin Durant", "Nikola Jokic", "Joel Embiid", 
-        "Damian Lillard", "Anthony Davis", "Kawhi Leonard", "Jimmy Butler",
-        "Paul George", "Devin Booker", "Trae Young", "Ja Morant",
-        "Zion Williamson", "Tyler Herro", "Bam Adebayo", "Scottie Barnes"
-    ]
-    
-    NBA_TEAMS = [
-        "Lakers", "Warriors", "Celtics", "Heat", "Nets", "76ers", "Bucks",
-        "Nuggets", "Suns", "Clippers", "Mavericks", "Grizzlies", "Pelicans",
-        "Trail Blazers", "Kings", "Timberwolves", "Thunder", "Rockets",
-        "Spurs", "Jazz", "Hawks", "Hornets", "Bulls", "Cavaliers",
-        "Pistons", "Pacers", "Magic", "Knicks", "Raptors", "Wizards"
-    ]
-    
-    STAT_TYPES = [
-        "points", "assists", "rebounds", "steals", "blocks", "field goal percentage",
-        "three point percentage", "free throw percentage", "minutes", "turnovers"
-    ]
+    # Catalogs live at module level; kept here for existing callers
+    POPULAR_PLAYERS = POPULAR_PLAYERS
+    NBA_TEAMS = NBA_TEAMS
+    STAT_TYPES = STAT_TYPES
     
     @staticmethod
-    def suggest_players(partial_name: str, limit: int = 5) -> List[str]:
+    def suggest_players(partial_name: str, limit: int = _SUGGESTION_LIMIT) -> Tuple[str, ...]:
         """Suggest player names based on partial input"""
         if not partial_name:
-            return SmartInterface.POPULAR_PLAYERS[:limit]
-        
-        matches = get_close_matches(
-            partial_name, 
-            SmartInterface.POPULAR_PLAYERS, 
-            n=limit, 
-            cutoff=0.3
-        )
+            return _DEFAULT_PLAYER_SUGGESTIONS if limit == _SUGGESTION_LIMIT else POPULAR_PLAYERS[:limit]
         
         # Also include starts-with matches
-        starts_with = [name for name in SmartInterface.POPULAR_PLAYERS 
-                      if name.lower().startswith(partial_name.lower())]
+        prefix = partial_name.lower()
+        starts_with = (name for name, name_lc in zip(POPULAR_PLAYERS, _POPULAR_PLAYERS_LOWER)
+                       if name_lc.startswith(prefix))
+        
+        # A single character is too short to fuzzy match usefully
+        if len(prefix) < 2:
+            return _first_unique(starts_with, limit)
+        
+        matches = top_k(partial_name, _PLAYER_NAME_CODES, limit, _max_edits(partial_name))
         
         # Combine and deduplicate
-        combined = list(dict.fromkeys(starts_with + matches))
-        return combined[:limit]
+        return _first_unique(chain(starts_with, matches), limit)
     
     @staticmethod
-    def suggest_teams(partial_name: str, limit: int = 5) -> List[str]:
+    def suggest_teams(partial_name: str, limit: int = _SUGGESTION_LIMIT) -> Tuple[str, ...]:
         """Suggest team names based on partial input"""
         if not partial_name:
-            return SmartInterface.NBA_TEAMS[:limit]
+            return _DEFAULT_TEAM_SUGGESTIONS if limit == _SUGGESTION_LIMIT else NBA_TEAMS[:limit]
         
-        matches = get_close_matches(
-            partial_name, 
-            SmartInterface.NBA_TEAMS, 
-            n=limit, 
-            cutoff=0.3
-        )
+        # Also include starts-with matches
+        prefix = partial_name.lower()
+        starts_with = (name for name, name_lc in zip(NBA_TEAMS, _NBA_TEAMS_LOWER)
+                       if name_lc.startswith(prefix))
+        
+        # A single character is too short to fuzzy match usefully
+        if len(prefix) < 2:
+            return _first_unique(starts_with, limit)
         
-        starts_with = [name for name in SmartInterface.NBA_TEAMS 
-                      if name.lower().startswith(partial_name.lower())]
+        matches = top_k(partial_name, _TEAM_NAME_CODES, limit, _max_edits(partial_name))
         
-        combined = list(dict.fromkeys(starts_with + matches))
-        return combined[:limit]
+        # Combine and deduplicate
+        return _first_unique(chain(starts_with, matches), limit)
     
     @staticmethod
     def generate_smart_suggestions(user_input: str = "") -> List[str]:
@@ -88,29 +150,34 @@ class SmartInterface:
         
         # Generate contextual suggestions based on input
         contextual = []
+        user_input_lc = user_input.lower()
+        
+        tokens = _TOKEN_RE.findall(user_input_lc)
         
         # If user mentions a player
-        for player in SmartInterface.POPULAR_PLAYERS:
-            if player.lower() in user_input.lower():
-                contextual.extend([
-                    f"Compare {player} to other stars",
-                    f"{player} season progression",
-                    f"{player} vs team average"
-                ])
-                break
+        player = _probe_tokens(tokens, _PLAYER_TOKEN_INDEX) or next(
+            (player for player, player_lc in zip(POPULAR_PLAYERS, _POPULAR_PLAYERS_LOWER)
+             if player_lc in user_input_lc), None)
+        if player:
+            contextual.extend([
+                f"Compare {player} to other stars",
+                f"{player} season progression",
+                f"{player} vs team average"
+            ])
         
         # If user mentions a team
-        for team in SmartInterface.NBA_TEAMS:
-            if team.lower() in user_input.lower():
-                contextual.extend([
-                    f"{team} next 5 games",
-                    f"{team} top performers",
-                    f"{team} season record"
-                ])
-                break
+        team = _probe_tokens(tokens, _TEAM_TOKEN_INDEX) or next(
+            (team for team, team_lc in zip(NBA_TEAMS, _NBA_TEAMS_LOWER)
+             if team_lc in user_input_lc), None)
+        if team:
+            contextual.extend([
+                f"{team} next 5 games",
+                f"{team} top performers",
+                f"{team} season record"
+            ])
         
         # If user mentions stats
-        if any(stat in user_input.lower() for stat in ["points", "assists", "rebounds"]):
+        if _STAT_MENTION_SEARCH(user_input_lc):
             contextual.extend([
                 "League leaders in this stat",
                 "Compare top 3 players",
@@ -120,80 +187,70 @@ class SmartInterface:
         return contextual[:3] if contextual else base_suggestions[:3]
     
     @staticmethod
-    def parse_query_intent(query: str) -> Dict[str, any]:
+    def parse_query_intent(query: str) -> "QueryIntent":
         """Parse user query to understand intent and extract entities"""
-        intent = {
-            "type": "general",
-            "entities": {
-                "players": [],
-                "teams": [],
-                "stats": [],
-                "timeframe": None
-            },
-            "comparison": False,
-            "confidence": 0.5
-        }
-        
+        entities = {"players": [], "teams": [], "stats": []}
+        query_type = "general"
         query_lower = query.lower()
         
+        # Extract entities and keyword categories in a single pass
+        query_re, query_table = _QUERY_AUTOMATON
+        seen = 0
+        found = set()
+        for match in query_re.finditer(query_lower):
+            for payload in query_table[match.group(1)]:
+                category, value = payload
+                seen |= category
+                kind = _ENTITY_KINDS.get(category)
+                if kind and payload not in found:
+                    found.add(payload)
+                    entities[kind].append(value)
+        
         # Detect comparison queries
-        comparison_keywords = ["vs", "versus", "compare", "against", "between"]
-        if any(keyword in query_lower for keyword in comparison_keywords):
-            intent["comparison"] = True
-            intent["type"] = "comparison"
-            intent["confidence"] += 0.2
-        
-        # Extract players
-        for player in SmartInterface.POPULAR_PLAYERS:
-            if player.lower() in query_lower:
-                intent["entities"]["players"].append(player)
-                intent["confidence"] += 0.3
-        
-        # Extract teams
-        for team in SmartInterface.NBA_TEAMS:
-            if team.lower() in query_lower:
-                intent["entities"]["teams"].append(team)
-                intent["confidence"] += 0.2
-        
-        # Extract stat types
-        for stat in SmartInterface.STAT_TYPES:
-            if stat in query_lower:
-                intent["entities"]["stats"].append(stat)
-                intent["confidence"] += 0.1
-        
-        # Detect query types
-        if any(word in query_lower for word in ["schedule", "next", "game", "when"]):
-            intent["type"] = "schedule"
-        elif any(word in query_lower for word in ["stats", "points", "assists", "rebounds"]):
-            intent["type"] = "stats"
-        elif any(word in query_lower for word in ["standings", "rank", "record"]):
-            intent["type"] = "standings"
-        
-        return intent
+        comparison = bool(seen & _COMPARISON)
+        if comparison:
+            query_type = "comparison"
+        
+        # Detect query types, highest priority first
+        for category, category_type in _QUERY_TYPE_PRIORITY:
+            if seen & category:
+                query_type = category_type
+                break
+        
+        confidence = (0.5 + 0.2 * comparison
+                      + 0.3 * len(entities["players"])
+                      + 0.2 * len(entities["teams"])
+                      + 0.1 * len(entities["stats"]))
+        
+        return QueryIntent(
+            type=query_type,
+            players=tuple(entities["players"]),
+            teams=tuple(entities["teams"]),
+            stats=tuple(entities["stats"]),
+            comparison=comparison,
+            confidence=confidence
+        )
     
     @staticmethod
     def create_autocomplete_input(label: str, key: str, data_type: str = "player") -> str:
         """Create an autocomplete-style input field"""
+        import streamlit as st
         
         # Create the input field
         user_input = st.text_input(label, key=key)
         
         if user_input:
-            # Generate suggestions based on input
-            if data_type == "player":
-                suggestions = SmartInterface.suggest_players(user_input)
-            elif data_type == "team":
-                suggestions = SmartInterface.suggest_teams(user_input)
-            else:
-                suggestions = []
+            # Generate suggestions based on input; reruns on every keystroke hit the cache
+            suggestions = _autocomplete_suggestions(data_type, user_input)
             
             if suggestions:
                 st.markdown("**Suggestions:**")
-                suggestion_cols = st.columns(min(len(suggestions), 3))
+                suggestion_cols = st.columns(len(suggestions))
+                button_keys = _suggestion_button_keys(key)
                 
-                for i, suggestion in enumerate(suggestions[:3]):
+                for i, suggestion in enumerate(suggestions):
                     with suggestion_cols[i]:
-                        if st.button(f"📝 {suggestion}", key=f"{key}_suggest_{i}"):
+                        if st.button(f"📝 {suggestion}", key=button_keys[i]):
                             st.session_state[key] = suggestion
                             st.rerun()
         
@@ -202,6 +259,8 @@ class SmartInterface:
     @staticmethod
     def create_smart_query_builder() -> str:
         """Create an interactive query builder"""
+        import streamlit as st
+        
         st.markdown("### 🎯 Smart Query Builder")
         
         # Query type selection
@@ -217,7 +276,7 @@ class SmartInterface:
             with col1:
                 player = SmartInterface.create_autocomplete_input("Player Name:", "qb_player", "player")
             with col2:
-                stat = st.selectbox("Stat Type:", ["All Stats"] + SmartInterface.STAT_TYPES)
+                stat = st.selectbox("Stat Type:", ["All Stats", *STAT_TYPES])
             
             if player:
                 if stat == "All Stats":
@@ -248,7 +307,7 @@ class SmartInterface:
                     built_query = f"Show me the {team} roster"
         
         elif query_type == "League Leaders":
-            stat = st.selectbox("Stat Category:", SmartInterface.STAT_TYPES)
+            stat = st.selectbox("Stat Category:", STAT_TYPES)
             built_query = f"Who leads the league in {stat}?"
         
         if built_query:
@@ -258,12 +317,133 @@ class SmartInterface:
         
         return ""
 
+# Category bits tagged onto every pattern in the query automaton
+_PLAYER, _TEAM, _STAT, _COMPARISON, _SCHEDULE_QUERY, _STATS_QUERY, _STANDINGS_QUERY = (
+    1 << bit for bit in range(7)
+)
+_ENTITY_KINDS = {_PLAYER: "players", _TEAM: "teams", _STAT: "stats"}
+_QUERY_KEYWORDS = {
+    _COMPARISON: frozenset({"vs", "versus", "compare", "against", "between"}),
+    _SCHEDULE_QUERY: frozenset({"schedule", "next", "game", "when"}),
+    _STATS_QUERY: frozenset({"stats", "points", "assists", "rebounds"}),
+    _STANDINGS_QUERY: frozenset({"standings", "rank", "record"})
+}
+_QUERY_TYPE_PRIORITY = (
+    (_SCHEDULE_QUERY, "schedule"),
+    (_STATS_QUERY, "stats"),
+    (_STANDINGS_QUERY, "standings")
+)
+
+def _build_query_automaton() -> Tuple["re.Pattern", Dict[str, tuple]]:
+    """Compile every catalog entry and intent keyword into one multi-pattern matcher.
+
+    Each pattern maps to (category bit, display value) payloads; keywords
+    carry no value. The zero-width lookahead reports the longest pattern
+    starting at each position of the query, so overlapping names
+    ("hornets"/"nets") are all found. Patterns that are a prefix of a longer
+    one are folded into its payload so they are not hidden by the
+    longest-first alternation.
+    """
+    payloads = {}
+    for category, names in ((_PLAYER, POPULAR_PLAYERS),
+                            (_TEAM, NBA_TEAMS),
+                            (_STAT, STAT_TYPES)):
+        for name in names:
+            payloads.setdefault(name.lower(), []).append((category, name))
+    for category, keywords in _QUERY_KEYWORDS.items():
+        for keyword in keywords:
+            payloads.setdefault(keyword, []).append((category, None))
+    
+    table = {
+        pattern: tuple(entry for other, entries in payloads.items()
+                       if pattern.startswith(other) for entry in entries)
+        for pattern in payloads
+    }
+    alternation = "|".join(re.escape(p) for p in sorted(payloads, key=len, reverse=True))
+    return re.compile(f"(?=({alternation}))"), table
+
+_QUERY_AUTOMATON = _build_query_automaton()
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+def _build_token_index(names: List[str], lowered: Tuple[str, ...],
+                       first_names: bool = False) -> Dict[str, str]:
+    """Map lowercased full names (and optionally first names) to display names"""
+    index = {}
+    for name, name_lc in zip(names, lowered):
+        index.setdefault(name_lc, name)
+        if first_names:
+            index.setdefault(name_lc.split()[0], name)
+    return index
+
+def _probe_tokens(tokens: List[str], index: Dict[str, str]) -> Optional[str]:
+    """Return the first name whose key matches a one- or two-word n-gram of the query"""
+    for i, token in enumerate(tokens):
+        if i + 1 < len(tokens):
+            hit = index.get(f"{token} {tokens[i + 1]}")
+            if hit:
+                return hit
+        hit = index.get(token)
+        if hit:
+            return hit
+    return None
+
+_PLAYER_TOKEN_INDEX = _build_token_index(POPULAR_PLAYERS,
+                                         _POPULAR_PLAYERS_LOWER,
+                                         first_names=True)
+_TEAM_TOKEN_INDEX = _build_token_index(NBA_TEAMS, _NBA_TEAMS_LOWER)
+
+# Catalog names pre-encoded for the fuzzy suggestion scorer
+_PLAYER_NAME_CODES = encode_names(POPULAR_PLAYERS)
+_TEAM_NAME_CODES = encode_names(NBA_TEAMS)
+
+def _max_edits(partial_name: str) -> int:
+    """Typo budget for fuzzy suggestions: one edit per three typed characters.
+
+    Two characters must match exactly: a single edit would let them begin
+    almost any word.
+    """
+    return len(partial_name) // 3
+
+def _first_unique(candidates: Iterable[str], limit: int) -> Tuple[str, ...]:
+    """Return the first `limit` distinct candidates, in order"""
+    unique = []
+    seen = set()
+    for candidate in candidates:
+        if candidate not in seen:
+            seen.add(candidate)
+            unique.append(candidate)
+            if len(unique) >= limit:
+                break
+    return tuple(unique)
+
+# Number of suggestion buttons shown under an autocomplete input
+_AUTOCOMPLETE_BUTTONS = 3
+
+@lru_cache(maxsize=256)
+def _autocomplete_suggestions(data_type: str, partial_name: str) -> Tuple[str, ...]:
+    """Suggestions shown under an autocomplete input, memoized across Streamlit reruns"""
+    if data_type == "player":
+        suggestions = SmartInterface.suggest_players(partial_name)
+    elif data_type == "team":
+        suggestions = SmartInterface.suggest_teams(partial_name)
+    else:
+        suggestions = ()
+    return suggestions[:_AUTOCOMPLETE_BUTTONS]
+
+@lru_cache(maxsize=64)
+def _suggestion_button_keys(key: str) -> Tuple[str, ...]:
+    """Widget keys for the suggestion buttons of one autocomplete input"""
+    return tuple(f"{key}_suggest_{i}" for i in range(_AUTOCOMPLETE_BUTTONS))
+
 class VoiceInterface:
     """Voice interface capabilities (placeholder for future implementation)"""
     
     @staticmethod
     def create_voice_input_button():
         """Create a voice input button (UI only for now)"""
+        import streamlit as st
+        
         st.markdown("""
         <div style="text-align: center; margin: 20px 0;">
             <button class="voice-input" onclick="alert('Voice input coming soon!')">
@@ -276,14 +456,9 @@ class VoiceInterface:
         """, unsafe_allow_html=True)
     
     @staticmethod
-    def simulate_voice_commands() -> List[str]:
+    def simulate_voice_commands() -> Tuple[str, ...]:
         """Simulate popular voice commands"""
-        return [
-            "Hey NBA Agent, what are LeBron's stats?",
-            "Show me Warriors next game",
-            "Compare Giannis and Embiid",
-            "Who's leading in scoring?"
-        ]
+        return _VOICE_COMMANDS
 
 class QueryOptimizer:
     """Optimize user queries for better agent performance"""
@@ -293,25 +468,18 @@ class QueryOptimizer:
         """Enhance user query with context and specificity"""
         enhanced = original_query.strip()
         
+        # Find every trigger word in one pass; nothing appended below adds one
+        triggers = set(_ENHANCE_TRIGGER_RE.findall(enhanced.lower()))
+        
         # Add current season context if not specified
-        if not any(season in enhanced for season in ["2024-25", "2023-24", "2022-23"]):
-            if any(word in enhanced.lower() for word in ["stats", "points", "assists", "rebounds"]):
-                enhanced += " for the 2024-25 season"
+        if not triggers & _SEASONS and triggers & _STAT_WORDS:
+            enhanced += " for the 2024-25 season"
         
         # Expand abbreviations
-        abbreviations = {
-            "pts": "points",
-            "ast": "assists", 
-            "reb": "rebounds",
-            "stl": "steals",
-            "blk": "blocks"
-        }
-        
-        for abbr, full in abbreviations.items():
-            enhanced = re.sub(rf'\b{abbr}\b', full, enhanced, flags=re.IGNORECASE)
+        enhanced = _ABBR_RE.sub(lambda m: _ABBREVIATIONS[m.group(1).lower()], enhanced)
         
         # Add specificity hints
-        if "compare" in enhanced.lower() and "stats" not in enhanced.lower():
+        if "compare" in triggers and "stats" not in triggers:
             enhanced += " stats"
         
         return enhanced
@@ -323,15 +491,15 @@ class QueryOptimizer:
         
         intent = SmartInterface.parse_query_intent(query)
         
-        if intent["type"] == "stats" and len(intent["entities"]["players"]) == 1:
-            player = intent["entities"]["players"][0]
+        if intent.type == "stats" and len(intent.players) == 1:
+            player = intent.players[0]
             refinements.extend([
                 f"Compare {player} to league average",
                 f"{player} game-by-game stats",
                 f"{player} vs position peers"
             ])
         
-        elif intent["type"] == "schedule":
+        elif intent.type == "schedule":
             refinements.extend([
                 "Show full month schedule",
                 "Include game times and TV",
@@ -4,54 +4,64 @@ Test the new real-time NBA tools
 """
 
 from tools import StatsTool, ScheduleTool, StandingsTool, RosterTool, ArenaTool
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import json
+import threading
+
+# Tools run concurrently, so keep each print in one piece
+_print_lock = threading.Lock()
+
+def _print(*args, **kwargs):
+    with _print_lock:
+        print(*args, **kwargs)
 
 def test_stats_tool():
     """Test the stats tool with Luka"""
-    print("=== Testing StatsTool ===")
+    _print("=== Testing StatsTool ===")
     
     tool = StatsTool()
     
-    # Test Luka assists
-    result = tool._run("Luka assists")
-    print(f"Luka assists: {result}")
-    
-    # Test LeBron all stats
-    result = tool._run("LeBron James")
-    print(f"LeBron all stats: {result}")
+    # Test Luka assists and LeBron all stats
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        luka, lebron = executor.map(tool._run, ["Luka assists", "LeBron James"])
+    _print(f"Luka assists: {luka}")
+    _print(f"LeBron all stats: {lebron}")
 
 def test_roster_tool():
     """Test the roster tool with Mavericks"""
-    print("\n=== Testing RosterTool ===")
+    _print("\n=== Testing RosterTool ===")
     
     tool = RosterTool()
     
     # Test Mavericks roster
     result = tool._run("Dallas Mavericks")
-    print(f"Mavericks roster: {result}")
+    _print(f"Mavericks roster: {result}")
 
 def test_standings_tool():
     """Test the standings tool with Lakers"""
-    print("\n=== Testing StandingsTool ===")
+    _print("\n=== Testing StandingsTool ===")
     
     tool = StandingsTool()
     
     # Test Lakers standings
     result = tool._run("Lakers")
-    print(f"Lakers standings: {result}")
+    _print(f"Lakers standings: {result}")
 
 def test_schedule_tool():
     """Test the schedule tool"""
-    print("\n=== Testing ScheduleTool ===")
+    _print("\n=== Testing ScheduleTool ===")
     
     tool = ScheduleTool()
     
     # Test Lakers schedule
     result = tool._run("Lakers")
-    print(f"Lakers schedule: {result}")
+    _print(f"Lakers schedule: {result}")
 
 if __name__ == "__main__":
-    test_stats_tool()
-    test_roster_tool()
-    test_standings_tool()
-    test_schedule_tool() 
\ No newline at end of file
+    # Each tool is an independent NBA API call, so run them side by side
+    tests = (test_stats_tool, test_roster_tool, test_standings_tool, test_schedule_tool)
+    with ThreadPoolExecutor(max_workers=len(tests)) as executor:
+        futures = {executor.submit(test): test.__name__ for test in tests}
+        for future in as_completed(futures):
+            future.result()
+            _print(f"[{futures[future]}] done") 
\ No newline at end of file
@@ -1,52 +1,130 @@
 import streamlit as st
-import plotly.express as px
 import plotly.graph_objects as go
-from plotly.subplots import make_subplots
-import pandas as pd
 import numpy as np
+from operator import itemgetter
 from typing import Dict, List
-import json
+
+try:
+    from numba import guvectorize, njit
+except ImportError:
+    guvectorize = njit = None
+
+def _rolling_mean(values, window):
+    """Trailing mean over `window` values, NaN until the window is full"""
+    out = np.full(values.shape[0], np.nan)
+    total = 0.0
+    for i in range(values.shape[0]):
+        total += values[i]
+        if i >= window:
+            total -= values[i - window]
+        if i >= window - 1:
+            out[i] = total / window
+    return out
+
+
+if njit is not None:
+    _rolling_mean = njit(cache=True)(_rolling_mean)
+else:
+    def _rolling_mean(values, window):
+        """Trailing mean over `window` values, NaN until the window is full"""
+        out = np.full(values.shape[0], np.nan)
+        if values.shape[0] >= window:
+            sums = np.cumsum(np.concatenate(([0.0], values)))
+            out[window - 1:] = (sums[window:] - sums[:-window]) / window
+        return out
+
+# Radar chart scale: stat key -> value drawn at the outer ring
+_RADAR_SCALE = {
+    'ppg': 35, 'apg': 12, 'rpg': 15, 'spg': 3, 'bpg': 3,
+    'fg_pct': 60, 'fg3_pct': 50, 'ft_pct': 95
+}
+_RADAR_KEYS = tuple(_RADAR_SCALE)
+_RADAR_MAX = np.array(list(_RADAR_SCALE.values()), dtype=np.float64)
+# Percentages are already on a 0-100 scale and are only capped
+_RADAR_IS_PCT = np.array([key.endswith('_pct') for key in _RADAR_KEYS])
+
+
+def _radar_kernel(values, maxes, is_pct, out):
+    for i in range(values.shape[0]):
+        if is_pct[i]:
+            out[i] = min(values[i], maxes[i])
+        else:
+            out[i] = min(values[i] / maxes[i] * 100.0, 100.0)
+
+
+if guvectorize is not None:
+    _radar_kernel = guvectorize(['void(float64[:], float64[:], boolean[:], float64[:])'],
+                                '(n),(n),(n)->(n)', nopython=True, cache=True)(_radar_kernel)
+
+    def _normalize_radar(stat_values):
+        """Scale radar stats to 0-100; accepts one row or a (players, stats) batch"""
+        return _radar_kernel(stat_values, _RADAR_MAX, _RADAR_IS_PCT)
+else:
+    def _normalize_radar(stat_values):
+        """Scale radar stats to 0-100; accepts one row or a (players, stats) batch"""
+        return np.where(_RADAR_IS_PCT,
+                        np.minimum(stat_values, _RADAR_MAX),
+                        np.minimum(stat_values / _RADAR_MAX * 100, 100))
+
+# Basketball court coordinates (simplified)
+_COURT_X = [-250, 250, 250, -250, -250]
+_COURT_Y = [-47.5, -47.5, 422.5, 422.5, -47.5]
+
+# Three-point line (simplified arc), computed once at import
+_ARC_THETA = np.linspace(-np.pi/2, np.pi/2, 50)
+_THREE_POINT_X = (237.5 * np.cos(_ARC_THETA)).tolist()
+_THREE_POINT_Y = (237.5 * np.sin(_ARC_THETA) + 53).tolist()
+
+# Comparison chart: missing stats default to 0, gathered in one itemgetter call
+_COMPARISON_KEYS = ('ppg', 'apg', 'rpg', 'spg', 'bpg', 'fg_pct', 'fg3_pct', 'ft_pct')
+_COMPARISON_DEFAULTS = dict.fromkeys(_COMPARISON_KEYS, 0)
+_COMPARISON_VALUES = itemgetter(*_COMPARISON_KEYS)
+
+# Stat cards: stat key, animation delay, accent color, label, value suffix, caption
+_STAT_CARD_SPECS = (
+    ('ppg', '0.5s', '#ff6b35', '🏀 POINTS', '', 'per game'),
+    ('apg', '0.6s', '#667eea', '🤝 ASSISTS', '', 'per game'),
+    ('rpg', '0.7s', '#ffd700', '🔄 REBOUNDS', '', 'per game'),
+    ('fg_pct', '0.8s', '#28a745', '🎯 FG%', '%', 'field goal'),
+)
+_STAT_CARD_GRID = "display: grid; grid-template-columns: repeat(4, 1fr); gap: 10px;"
+_STAT_CARD = (
+    '<div class="metric-card" style="text-align: center; animation: slideInUp {delay} ease-out;">'
+    '<h3 style="color: {color}; margin: 0;">{label}</h3>'
+    '<h1 style="color: white; margin: 5px 0; font-size: 2.5rem;">{value:.1f}{suffix}</h1>'
+    '<p style="color: #ccc; margin: 0;">{caption}</p>'
+    '</div>'
+)
+
+# Chart builders are pure functions of their inputs, so identical stats on a
+# Streamlit rerun reuse the figure instead of rebuilding it
+_FIGURE_CACHE = dict(ttl=3600, max_entries=256, show_spinner=False)
 
 class NBAVisualizations:
     """Enhanced NBA visualizations for better user experience"""
     
     @staticmethod
+    @st.cache_data(**_FIGURE_CACHE)
     def create_player_radar_chart(player_data: Dict) -> go.Figure:
         """Create a radar chart for player stats"""
         stats = player_data.get('stats', {})
         
-        # Normalize stats to 0-100 scale for radar chart
-        max_values = {
-            'ppg': 35, 'apg': 12, 'rpg': 15, 'spg': 3, 'bpg': 3,
-            'fg_pct': 60, 'fg3_pct': 50, 'ft_pct': 95
-        }
-        
         categories = ['Points/Game', 'Assists/Game', 'Rebounds/Game', 
                      'Steals/Game', 'Blocks/Game', 'FG%', '3P%', 'FT%']
         
-        values = []
-        stat_keys = ['ppg', 'apg', 'rpg', 'spg', 'bpg', 'fg_pct', 'fg3_pct', 'ft_pct']
-        
-        for i, key in enumerate(stat_keys):
-            stat_value = stats.get(key, 0)
-            if key.endswith('_pct'):
-                normalized = min(stat_value, max_values[key])
-            else:
-                normalized = min((stat_value / max_values[key]) * 100, 100)
-            values.append(normalized)
-        
-        fig = go.Figure()
+        # Normalize stats to 0-100 scale for radar chart
+        stat_values = np.fromiter((stats.get(key, 0) for key in _RADAR_KEYS),
+                                  dtype=np.float64, count=len(_RADAR_KEYS))
+        values = _normalize_radar(stat_values).tolist()
         
-        fig.add_trace(go.Scatterpolar(
+        fig = go.Figure(data=[go.Scatterpolar(
             r=values,
             theta=categories,
             fill='toself',
             name=player_data.get('player', 'Player'),
             line_color='rgb(255, 107, 53)',
             fillcolor='rgba(255, 107, 53, 0.25)'
-        ))
-        
-        fig.update_layout(
+        )], layout=dict(
             polar=dict(
                 radialaxis=dict(
                     visible=True,
@@ -67,44 +145,34 @@ class NBAVisualizations:
             font=dict(color='white'),
             paper_bgcolor='rgba(0,0,0,0)',
             plot_bgcolor='rgba(0,0,0,0)'
-        )
+        ), skip_invalid=True)
         
         return fig
     
     @staticmethod
+    @st.cache_data(**_FIGURE_CACHE)
     def create_stat_comparison_chart(player1_data: Dict, player2_data: Dict) -> go.Figure:
         """Create side-by-side stat comparison"""
         categories = ['PPG', 'APG', 'RPG', 'SPG', 'BPG', 'FG%', '3P%', 'FT%']
         
-        player1_stats = player1_data.get('stats', {})
-        player2_stats = player2_data.get('stats', {})
-        
-        stat_keys = ['ppg', 'apg', 'rpg', 'spg', 'bpg', 'fg_pct', 'fg3_pct', 'ft_pct']
+        player1_values = _COMPARISON_VALUES({**_COMPARISON_DEFAULTS, **player1_data.get('stats', {})})
+        player2_values = _COMPARISON_VALUES({**_COMPARISON_DEFAULTS, **player2_data.get('stats', {})})
         
-        player1_values = [player1_stats.get(key, 0) for key in stat_keys]
-        player2_values = [player2_stats.get(key, 0) for key in stat_keys]
-        
-        fig = go.Figure()
-        
-        fig.add_trace(go.Bar(
+        fig = go.Figure(data=[go.Bar(
             name=player1_data.get('player', 'Player 1'),
             x=categories,
             y=player1_values,
             marker_color='rgb(255, 107, 53)',
             text=player1_values,
             textposition='auto'
-        ))
-        
-        fig.add_trace(go.Bar(
+        ), go.Bar(
             name=player2_data.get('player', 'Player 2'),
             x=categories,
             y=player2_values,
             marker_color='rgb(102, 126, 234)',
             text=player2_values,
             textposition='auto'
-        ))
-        
-        fig.update_layout(
+        )], layout=dict(
             title='Player Comparison',
             xaxis_title='Statistics',
             yaxis_title='Value',
@@ -114,80 +182,67 @@ class NBAVisualizations:
             plot_bgcolor='rgba(0,0,0,0)',
             xaxis=dict(gridcolor='rgba(255, 255, 255, 0.3)'),
             yaxis=dict(gridcolor='rgba(255, 255, 255, 0.3)')
-        )
+        ), skip_invalid=True)
         
         return fig
     
     @staticmethod
+    @st.cache_data(**_FIGURE_CACHE)
     def create_shooting_chart(player_data: Dict) -> go.Figure:
         """Create a basketball court with shooting percentages"""
-        # Basketball court coordinates (simplified)
-        court_x = [-250, 250, 250, -250, -250]
-        court_y = [-47.5, -47.5, 422.5, 422.5, -47.5]
-        
-        fig = go.Figure()
-        
-        # Draw court outline
-        fig.add_trace(go.Scatter(
-            x=court_x, y=court_y,
-            mode='lines',
-            line=dict(color='white', width=2),
-            showlegend=False,
-            name='Court'
-        ))
-        
-        # Add three-point line (simplified arc)
-        theta = np.linspace(-np.pi/2, np.pi/2, 50)
-        three_point_x = 237.5 * np.cos(theta)
-        three_point_y = 237.5 * np.sin(theta) + 53
-        
-        fig.add_trace(go.Scatter(
-            x=three_point_x, y=three_point_y,
-            mode='lines',
-            line=dict(color='white', width=2),
-            showlegend=False,
-            name='3-Point Line'
-        ))
-        
-        # Add shooting zones with percentages
         stats = player_data.get('stats', {})
         
-        # Paint area (close range)
-        fig.add_trace(go.Scatter(
-            x=[0], y=[100],
-            mode='markers+text',
-            marker=dict(
-                size=60,
-                color=stats.get('fg_pct', 0),
-                colorscale='RdYlGn',
-                cmin=0, cmax=70,
-                showscale=True,
-                colorbar=dict(title="FG%", titlefont=dict(color='white'))
+        fig = go.Figure(data=[
+            # Draw court outline
+            go.Scatter(
+                x=_COURT_X, y=_COURT_Y,
+                mode='lines',
+                line=dict(color='white', width=2),
+                showlegend=False,
+                name='Court'
             ),
-            text=f"Paint<br>{stats.get('fg_pct', 0):.1f}%",
-            textposition='middle center',
-            textfont=dict(color='white', size=12),
-            showlegend=False
-        ))
-        
-        # Three-point area
-        fig.add_trace(go.Scatter(
-            x=[0], y=[300],
-            mode='markers+text',
-            marker=dict(
-                size=60,
-                color=stats.get('fg3_pct', 0),
-                colorscale='RdYlGn',
-                cmin=0, cmax=50,
-                showscale=False
+            # Add three-point line (simplified arc)
+            go.Scatter(
+                x=_THREE_POINT_X, y=_THREE_POINT_Y,
+                mode='lines',
+                line=dict(color='white', width=2),
+                showlegend=False,
+                name='3-Point Line'
             ),
-            text=f"3-Point<br>{stats.get('fg3_pct', 0):.1f}%",
-            textposition='middle center',
-            textfont=dict(color='white', size=12),
-            showlegend=False
-        ))
-        
-        fig.update_layout(
+            # Paint area (close range)
+            go.Scatter(
+                x=[0], y=[100],
+                mode='markers+text',
+                marker=dict(
+                    size=60,
+                    color=stats.get('fg_pct', 0),
+                    colorscale='RdYlGn',
+                    cmin=0, cmax=70,
+                    showscale=True,
+                    colorbar=dict(title=dict(text="FG%", font=dict(color='white')))
+                ),
+                text=f"Paint<br>{stats.get('fg_pct', 0):.1f}%",
+                textposition='middle center',
+                textfont=dict(color='white', size=12),
+                showlegend=False
+            ),
+            # Three-point area
+            go.Scatter(
+                x=[0], y=[300],
+                mode='markers+text',
+                marker=dict(
+                    size=60,
+                    color=stats.get('fg3_pct', 0),
+                    colorscale='RdYlGn',
+                    cmin=0, cmax=50,
+                    showscale=False
+                ),
+                text=f"3-Point<br>{stats.get('fg3_pct', 0):.1f}%",
+                textposition='middle center',
+                textfont=dict(color='white', size=12),
+                showlegend=False
+            ),
+        ], layout=dict(
             title=f"{player_data.get('player', 'Player')} Shooting Chart",
             xaxis=dict(
                 range=[-300, 300],
@@ -207,58 +262,50 @@ class NBAVisualizations:
             font=dict(color='white'),
             paper_bgcolor='rgba(0,0,0,0)',
             plot_bgcolor='rgba(0,0,0,0)'
-        )
+        ), skip_invalid=True)
         
         return fig
     
     @staticmethod
+    @st.cache_data(**_FIGURE_CACHE)
     def create_season_progression(player_data: Dict) -> go.Figure:
         """Create a timeline showing season progression"""
         # Mock data for demonstration - in real app, this would come from game logs
-        games = list(range(1, 21))  # First 20 games
+        games = np.arange(1, 21)  # First 20 games
         stats = player_data.get('stats', {})
         base_ppg = stats.get('ppg', 20)
         
-        # Generate some realistic variation
-        np.random.seed(42)
-        points_per_game = base_ppg + np.random.normal(0, 5, 20)
-        points_per_game = np.maximum(points_per_game, 0)  # No negative points
+        # Generate some realistic variation; a fresh seeded generator keeps the
+        # chart deterministic without reseeding numpy's global RandomState
+        points_per_game = np.random.default_rng(42).standard_normal(20)
+        np.multiply(points_per_game, 5, out=points_per_game)
+        np.add(points_per_game, base_ppg, out=points_per_game)
+        np.maximum(points_per_game, 0, out=points_per_game)  # No negative points
         
         # Calculate rolling average
-        rolling_avg = pd.Series(points_per_game).rolling(window=5).mean()
-        
-        fig = go.Figure()
-        
-        # Individual game points
-        fig.add_trace(go.Scatter(
-            x=games,
-            y=points_per_game,
-            mode='markers',
-            name='Game Points',
-            marker=dict(color='rgb(255, 107, 53)', size=8),
-            text=[f"Game {g}: {p:.1f} pts" for g, p in zip(games, points_per_game)],
-            hovertemplate='%{text}<extra></extra>'
-        ))
-        
-        # Rolling average
-        fig.add_trace(go.Scatter(
-            x=games,
-            y=rolling_avg,
-            mode='lines',
-            name='5-Game Average',
-            line=dict(color='rgb(102, 126, 234)', width=3)
-        ))
-        
-        # Season average line
-        fig.add_hline(
-            y=base_ppg,
-            line_dash="dash",
-            line_color="rgb(255, 215, 0)",
-            annotation_text=f"Season Avg: {base_ppg:.1f}",
-            annotation_position="top right"
-        )
-        
-        fig.update_layout(
+        rolling_avg = _rolling_mean(points_per_game, 5)
+        
+        fig = go.Figure(data=[
+            # Individual game points
+            go.Scatter(
+                x=games,
+                y=points_per_game,
+                mode='markers',
+                name='Game Points',
+                marker=dict(color='rgb(255, 107, 53)', size=8),
+                text=np.char.add(np.char.add("Game ", games.astype(str)),
+                                 np.char.mod(": %.1f pts", points_per_game)).tolist(),
+                hovertemplate='%{text}<extra></extra>'
+            ),
+            # Rolling average
+            go.Scatter(
+                x=games,
+                y=rolling_avg,
+                mode='lines',
+                name='5-Game Average',
+                line=dict(color='rgb(102, 126, 234)', width=3)
+            ),
+        ], layout=dict(
             title=f"{player_data.get('player', 'Player')} Season Progression",
             xaxis_title='Game Number',
             yaxis_title='Points Per Game',
@@ -267,46 +314,57 @@ class NBAVisualizations:
             plot_bgcolor='rgba(0,0,0,0)',
             xaxis=dict(gridcolor='rgba(255, 255, 255, 0.3)'),
             yaxis=dict(gridcolor='rgba(255, 255, 255, 0.3)')
+        ), skip_invalid=True)
+        
+        # Season average line
+        fig.add_hline(
+            y=base_ppg,
+            line_dash="dash",
+            line_color="rgb(255, 215, 0)",
+            annotation_text=f"Season Avg: {base_ppg:.1f}",
+            annotation_position="top right"
         )
         
         return fig
     
     @staticmethod
+    @st.cache_data(**_FIGURE_CACHE)
     def create_team_heatmap(teams_data: List[Dict]) -> go.Figure:
         """Create a heatmap comparing multiple teams"""
         if not teams_data:
-            return go.Figure()
+            return go.Figure(skip_invalid=True)
         
         team_names = [team.get('team', f'Team {i}') for i, team in enumerate(teams_data)]
         stats_categories = ['Wins', 'Losses', 'Win %', 'Rank']
         
+        # pandas is only needed here, so it is not imported with the module
+        import pandas as pd
+        
         # Create matrix of team stats
-        heatmap_data = []
-        for team in teams_data:
-            wins = team.get('wins', 0)
-            losses = team.get('losses', 0)
-            win_pct = wins / (wins + losses) if (wins + losses) > 0 else 0
-            rank = team.get('rank', 15)
-            
-            heatmap_data.append([wins, losses, win_pct * 100, 31 - rank])  # Invert rank for coloring
+        frame = pd.DataFrame(teams_data).reindex(columns=['wins', 'losses', 'rank'])
+        wins = frame['wins'].fillna(0).to_numpy(dtype=np.float64)
+        losses = frame['losses'].fillna(0).to_numpy(dtype=np.float64)
+        rank = frame['rank'].fillna(15).to_numpy(dtype=np.float64)
+        games = wins + losses
+        win_pct = np.divide(wins, games, out=np.zeros_like(wins), where=games > 0)
+        
+        heatmap_data = np.column_stack([wins, losses, win_pct * 100, 31 - rank])  # Invert rank for coloring
         
-        fig = go.Figure(data=go.Heatmap(
-            z=heatmap_data,
+        fig = go.Figure(data=[go.Heatmap(
+            z=heatmap_data.tolist(),
             x=stats_categories,
             y=team_names,
             colorscale='RdYlGn',
-            text=[[f"{val:.1f}" for val in row] for row in heatmap_data],
+            text=np.char.mod("%.1f", heatmap_data).tolist(),
             texttemplate="%{text}",
             textfont={"size": 12, "color": "white"},
             hoverongaps=False
-        ))
-        
-        fig.update_layout(
+        )], layout=dict(
             title='Team Performance Comparison',
             font=dict(color='white'),
             paper_bgcolor='rgba(0,0,0,0)',
             plot_bgcolor='rgba(0,0,0,0)'
-        )
+        ), skip_invalid=True)
         
         return fig
     
@@ -316,44 +374,13 @@ class NBAVisualizations:
         stats = player_data.get('stats', {})
         player_name = player_data.get('player', 'Player')
         
-        # Create columns for stat cards
-        col1, col2, col3, col4 = st.columns(4)
-        
-        with col1:
-            st.markdown(f"""
-            <div class="metric-card" style="text-align: center; animation: slideInUp 0.5s ease-out;">
-                <h3 style="color: #ff6b35; margin: 0;">🏀 POINTS</h3>
-                <h1 style="color: white; margin: 5px 0; font-size: 2.5rem;">{stats.get('ppg', 0):.1f}</h1>
-                <p style="color: #ccc; margin: 0;">per game</p>
-            </div>
-            """, unsafe_allow_html=True)
-        
-        with col2:
-            st.markdown(f"""
-            <div class="metric-card" style="text-align: center; animation: slideInUp 0.6s ease-out;">
-                <h3 style="color: #667eea; margin: 0;">🤝 ASSISTS</h3>
-                <h1 style="color: white; margin: 5px 0; font-size: 2.5rem;">{stats.get('apg', 0):.1f}</h1>
-                <p style="color: #ccc; margin: 0;">per game</p>
-            </div>
-            """, unsafe_allow_html=True)
-        
-        with col3:
-            st.markdown(f"""
-            <div class="metric-card" style="text-align: center; animation: slideInUp 0.7s ease-out;">
-                <h3 style="color: #ffd700; margin: 0;">🔄 REBOUNDS</h3>
-                <h1 style="color: white; margin: 5px 0; font-size: 2.5rem;">{stats.get('rpg', 0):.1f}</h1>
-                <p style="color: #ccc; margin: 0;">per game</p>
-            </div>
-            """, unsafe_allow_html=True)
-        
-        with col4:
-            st.markdown(f"""
-            <div class="metric-card" style="text-align: center; animation: slideInUp 0.8s ease-out;">
-                <h3 style="color: #28a745; margin: 0;">🎯 FG%</h3>
-                <h1 style="color: white; margin: 5px 0; font-size: 2.5rem;">{stats.get('fg_pct', 0):.1f}%</h1>
-                <p style="color: #ccc; margin: 0;">field goal</p>
-            </div>
-            """, unsafe_allow_html=True)
+        # One markdown element for all four cards instead of a column each
+        cards = "".join(
+            _STAT_CARD.format(delay=delay, color=color, label=label,
+                              value=stats.get(key, 0), suffix=suffix, caption=caption)
+            for key, delay, color, label, suffix, caption in _STAT_CARD_SPECS
+        )
+        st.markdown(f'<div style="{_STAT_CARD_GRID}">{cards}</div>', unsafe_allow_html=True)
 
 class LiveGameWidget:
     """Widget for displaying live game information"""
@@ -388,71 +415,75 @@ class LiveGameWidget:
         </div>
         """, unsafe_allow_html=True)
 
-def add_enhanced_css():
-    """Add enhanced CSS animations and styling"""
-    st.markdown("""
-    <style>
-    @keyframes slideInUp {
-        from {
-            opacity: 0;
-            transform: translateY(20px);
-        }
-        to {
-            opacity: 1;
-            transform: translateY(0);
-        }
-    }
-    
-    @keyframes pulse {
-        0% { transform: scale(1); }
-        50% { transform: scale(1.02); }
-        100% { transform: scale(1); }
+# Sent on every run: Streamlit removes elements a rerun does not emit again, so
+# injecting the stylesheet once per session would unstyle the page on rerun
+_ENHANCED_CSS = """
+<style>
+@keyframes slideInUp {
+    from {
+        opacity: 0;
+        transform: translateY(20px);
     }
-    
-    @keyframes fadeIn {
-        from { opacity: 0; }
-        to { opacity: 1; }
-    }
-    
-    .metric-card {
-        background: linear-gradient(145deg, rgba(255,255,255,0.1), rgba(255,255,255,0.05));
-        padding: 20px;
-        border-radius: 15px;
-        margin: 10px 0;
-        border-left: 4px solid #ffd700;
-        backdrop-filter: blur(10px);
-        transition: all 0.3s ease;
-        animation: fadeIn 1s ease-out;
-    }
-    
-    .metric-card:hover {
-        transform: translateY(-5px);
-        box-shadow: 0 10px 20px rgba(255, 215, 0, 0.3);
-    }
-    
-    .interactive-button {
-        background: linear-gradient(45deg, #667eea, #764ba2);
-        color: white;
-        border: none;
-        padding: 10px 20px;
-        border-radius: 25px;
-        cursor: pointer;
-        transition: all 0.3s ease;
-        margin: 5px;
-    }
-    
-    .interactive-button:hover {
-        transform: translateY(-2px);
-        box-shadow: 0 5px 15px rgba(102, 126, 234, 0.4);
+    to {
+        opacity: 1;
+        transform: translateY(0);
     }
-    
-    .chart-container {
-        background: rgba(255, 255, 255, 0.05);
-        border-radius: 15px;
-        padding: 20px;
-        margin: 10px 0;
-        backdrop-filter: blur(10px);
-        border: 1px solid rgba(255, 255, 255, 0.1);
-    }
-    </style>
-    """, unsafe_allow_html=True) 
\ No newline at end of file
+}
+
+@keyframes pulse {
+    0% { transform: scale(1); }
+    50% { transform: scale(1.02); }
+    100% { transform: scale(1); }
+}
+
+@keyframes fadeIn {
+    from { opacity: 0; }
+    to { opacity: 1; }
+}
+
+.metric-card {
+    background: linear-gradient(145deg, rgba(255,255,255,0.1), rgba(255,255,255,0.05));
+    padding: 20px;
+    border-radius: 15px;
+    margin: 10px 0;
+    border-left: 4px solid #ffd700;
+    backdrop-filter: blur(10px);
+    transition: all 0.3s ease;
+    animation: fadeIn 1s ease-out;
+}
+
+.metric-card:hover {
+    transform: translateY(-5px);
+    box-shadow: 0 10px 20px rgba(255, 215, 0, 0.3);
+}
+
+.interactive-button {
+    background: linear-gradient(45deg, #667eea, #764ba2);
+    color: white;
+    border: none;
+    padding: 10px 20px;
+    border-radius: 25px;
+    cursor: pointer;
+    transition: all 0.3s ease;
+    margin: 5px;
+}
+
+.interactive-button:hover {
+    transform: translateY(-2px);
+    box-shadow: 0 5px 15px rgba(102, 126, 234, 0.4);
+}
+
+.chart-container {
+    background: rgba(255, 255, 255, 0.05);
+    border-radius: 15px;
+    padding: 20px;
+    margin: 10px 0;
+    backdrop-filter: blur(10px);
+    border: 1px solid rgba(255, 255, 255, 0.1);
+}
+</style>
+"""
+
+def add_enhanced_css():
+    """Add enhanced CSS animations and styling"""
+    st.markdown(_ENHANCED_CSS, unsafe_allow_html=True)
@@ -8,46 +8,61 @@ import subprocess
 import sys
 import os
 
+def _run(args):
+    """Replace the launcher with the app, or run it as a child on Windows"""
+    if os.name == "nt":
+        # No real exec on Windows: os.exec* spawns a new process and returns
+        subprocess.run(args)
+        return
+    sys.stdout.flush()
+    os.execvp(args[0], args)
+
+# app name -> (usage description, startup message, arguments for the interpreter)
+COMMANDS = {
+    "web": ("Original Streamlit web interface",
+            "Starting original web interface...",
+            ["-m", "streamlit", "run", "apps/app.py"]),
+    "web-ux": ("Enhanced UX Streamlit interface",
+               "Starting enhanced UX web interface...",
+               ["-m", "streamlit", "run", "apps/app_ux_improved.py"]),
+    "chat": ("Terminal chat interface",
+             "Starting terminal chat interface...",
+             ["apps/chat.py"]),
+    "enhanced": ("Enhanced chat with flexible query parsing",
+                 "Starting enhanced chat with flexible query parsing...",
+                 ["apps/enhanced_chat.py"]),
+    "plan": ("Agentic planning chat",
+             "Starting planning chat interface...",
+             ["apps/chat_planner.py"]),
+    "tests": ("Run test suite",
+              "Running test suite...",
+              ["run_judgment_tests.py"]),
+}
+
 def main():
     if len(sys.argv) < 2:
         print("🏀 NBA Agent Launcher")
         print("Usage: python launcher.py [app_name]")
         print("\nAvailable apps:")
-        print("  web       - Original Streamlit web interface")
-        print("  web-ux    - Enhanced UX Streamlit interface")
-        print("  chat      - Terminal chat interface")
-        print("  enhanced  - Enhanced chat with flexible query parsing")
-        print("  plan      - Agentic planning chat")
-        print("  tests     - Run test suite")
+        for name, (description, _, _) in COMMANDS.items():
+            print(f"  {name:<9} - {description}")
         print("\nExample: python launcher.py web-ux")
         return
     
     app_name = sys.argv[1].lower()
     
-    if app_name == "web":
-        print("🏀 Starting original web interface...")
-        subprocess.run([sys.executable, "-m", "streamlit", "run", "apps/app.py"])
-    elif app_name == "web-ux":
-        print("🏀 Starting enhanced UX web interface...")
-        subprocess.run([sys.executable, "-m", "streamlit", "run", "apps/app_ux_improved.py"])
-    elif app_name == "chat":
-        print("🏀 Starting terminal chat interface...")
-        subprocess.run([sys.executable, "apps/chat.py"])
-    elif app_name == "enhanced":
-        print("🏀 Starting enhanced chat with flexible query parsing...")
-        subprocess.run([sys.executable, "apps/enhanced_chat.py"])
-    elif app_name == "plan":
-        print("🏀 Starting planning chat interface...")
-        subprocess.run([sys.executable, "apps/chat_planner.py"])
-    elif app_name == "tests":
-        print("🏀 Running test suite...")
-        if len(sys.argv) > 2:
-            subprocess.run([sys.executable, "run_judgment_tests.py"] + sys.argv[2:])
-        else:
-            subprocess.run([sys.executable, "run_judgment_tests.py", "--help"])
-    else:
+    entry = COMMANDS.get(app_name)
+    if entry is None:
         print(f"❌ Unknown app: {app_name}")
-        print("Available: web, web-ux, chat, enhanced, plan, tests")
+        print(f"Available: {', '.join(COMMANDS)}")
+        return
+    
+    _, message, args = entry
+    if app_name == "tests":
+        # Forward the remaining arguments, or show the runner's help
+        args = args + (sys.argv[2:] or ["--help"])
+    print(f"🏀 {message}")
+    _run([sys.executable, *args])
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file
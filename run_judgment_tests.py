@@ -4,12 +4,19 @@ NBA Agent Test Runner using Judgment Labs
 Comprehensive test suite runner for evaluation, tracing, and performance testing
 """
 
-import argparse
 import sys
 import os
-from datetime import datetime
+from functools import lru_cache
 
-def main():
+TEST_TYPES = ('all', 'evaluation', 'tracing', 'performance')
+
+def parse_args(argv):
+    # A bare test type is the common invocation; answer it without argparse
+    if len(argv) == 1 and argv[0] in TEST_TYPES:
+        from types import SimpleNamespace
+        return SimpleNamespace(test_type=argv[0], project_name=None, model='gpt-4o', verbose=False)
+    
+    import argparse
     parser = argparse.ArgumentParser(
         description="🏀 NBA Agent Test Suite with Judgment Labs",
         formatter_class=argparse.RawTextHelpFormatter
@@ -17,7 +24,7 @@ def main():
     
     parser.add_argument(
         'test_type',
-        choices=['all', 'evaluation', 'tracing', 'performance'],
+        choices=TEST_TYPES,
         help="""Choose test type to run:
   all         - Run all test suites
   evaluation  - Run evaluation tests (accuracy, relevancy, faithfulness)
@@ -27,7 +34,7 @@ def main():
     
     parser.add_argument(
         '--project-name',
-        default=f"NBA Agent Tests - {datetime.now().strftime('%Y-%m-%d %H:%M')}",
+        default=None,
         help='Project name for Judgment Labs (default: timestamped)'
     )
     
@@ -43,7 +50,15 @@ def main():
         help='Enable verbose output'
     )
     
-    args = parser.parse_args()
+    return parser.parse_args(argv)
+
+def main():
+    args = parse_args(sys.argv[1:])
+    if args.project_name is None:
+        # Only timestamp the default when no name was given on the command line;
+        # time is already loaded by the interpreter, unlike datetime
+        import time
+        args.project_name = f"NBA Agent Tests - {time.strftime('%Y-%m-%d %H:%M')}"
     
     print("🏀 NBA Agent Test Suite with Judgment Labs")
     print("=" * 60)
@@ -60,17 +75,11 @@ def main():
     
     try:
         # Run selected tests
-        if args.test_type == 'evaluation' or args.test_type == 'all':
-            print("\n🎯 Running Evaluation Tests...")
-            run_evaluation_tests(args)
-        
-        if args.test_type == 'tracing' or args.test_type == 'all':
-            print("\n🔍 Running Tracing Tests...")
-            run_tracing_tests(args)
-        
-        if args.test_type == 'performance' or args.test_type == 'all':
-            print("\n⚡ Running Performance Tests...")
-            run_performance_tests(args)
+        selected = RUNNERS if args.test_type == 'all' else (args.test_type,)
+        for test_type in selected:
+            header, runner = RUNNERS[test_type]
+            print(f"\n{header}")
+            runner(args)
         
         print("\n🎉 All tests completed successfully!")
         print("✨ View results at: https://app.judgmentlabs.ai")
@@ -105,23 +114,29 @@ def run_evaluation_tests(args):
             ("Comprehensive Evaluation", test_suite.test_comprehensive_evaluation)
         ]
         
-        passed = 0
-        failed = 0
-        
+        # Run everything first, then report in one write; tracebacks are only
+        # formatted when --verbose asks for them
+        results = []
         for test_name, test_func in tests:
+            print(f"    🔄 Running {test_name}...")
             try:
-                print(f"    🔄 Running {test_name}...")
                 test_func()
-                print(f"    ✅ {test_name} passed")
-                passed += 1
+                results.append((test_name, None))
             except Exception as e:
-                print(f"    ❌ {test_name} failed: {e}")
-                failed += 1
-                if args.verbose:
-                    import traceback
-                    traceback.print_exc()
-        
-        print(f"\n  📊 Evaluation Results: {passed} passed, {failed} failed")
+                results.append((test_name, e))
+        
+        lines = []
+        for test_name, error in results:
+            if error is None:
+                lines.append(f"    ✅ {test_name} passed")
+                continue
+            lines.append(f"    ❌ {test_name} failed: {error}")
+            if args.verbose:
+                import traceback
+                lines.append("".join(traceback.TracebackException.from_exception(error).format()).rstrip())
+        failed = sum(error is not None for _, error in results)
+        lines.append(f"\n  📊 Evaluation Results: {len(results) - failed} passed, {failed} failed")
+        sys.stdout.write("\n".join(lines) + "\n")
         
     except ImportError as e:
         print(f"  ❌ Failed to import evaluation tests: {e}")
@@ -153,6 +168,10 @@ def run_tracing_tests(args):
         print(f"  ❌ Failed to import tracing tests: {e}")
         print("     Make sure judgeval is installed: pip install judgeval")
 
+@lru_cache(maxsize=32)
+def _pretty_category(category):
+    return category.replace('_', ' ').title()
+
 def run_performance_tests(args):
     """Run performance test suite"""
     try:
@@ -168,28 +187,38 @@ def run_performance_tests(args):
         print("    🔄 Running comprehensive performance tests...")
         results = performance_tester.run_comprehensive_performance_tests()
         
-        print(f"  📊 Performance Results:")
+        # Build the whole summary, then write it once
+        lines = ["  📊 Performance Results:"]
         
         # Response time summary
         if "response_times" in results:
             for category, metrics in results["response_times"].items():
-                print(f"    ⏱️ {category.replace('_', ' ').title()}: {metrics['avg_time']:.2f}s avg")
+                lines.append(f"    ⏱️ {_pretty_category(category)}: {metrics['avg_time']:.2f}s avg")
         
         # Concurrent load summary
         if "concurrent_load" in results:
             load_results = results["concurrent_load"]
-            print(f"    🚀 Concurrent Success: {load_results['success_rate']:.1%}")
-            print(f"    🔄 Concurrent Avg: {load_results['avg_response_time']:.2f}s")
+            lines.append(f"    🚀 Concurrent Success: {load_results['success_rate']:.1%}")
+            lines.append(f"    🔄 Concurrent Avg: {load_results['avg_response_time']:.2f}s")
         
         # Accuracy summary
         if "accuracy" in results:
             accuracy = sum(r["content_match"] for r in results["accuracy"]) / len(results["accuracy"])
-            print(f"    🎯 Content Accuracy: {accuracy:.1%}")
+            lines.append(f"    🎯 Content Accuracy: {accuracy:.1%}")
+        
+        sys.stdout.write("\n".join(lines) + "\n")
         
     except ImportError as e:
         print(f"  ❌ Failed to import performance tests: {e}")
         print("     Make sure judgeval is installed: pip install judgeval")
 
+# test type -> (header, runner); 'all' runs them in this order
+RUNNERS = {
+    'evaluation': ("🎯 Running Evaluation Tests...", run_evaluation_tests),
+    'tracing': ("🔍 Running Tracing Tests...", run_tracing_tests),
+    'performance': ("⚡ Running Performance Tests...", run_performance_tests),
+}
+
 def print_usage_examples():
     """Print usage examples"""
     print("""
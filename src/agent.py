@@ -1,67 +1,214 @@
 #langchain agent factory
+# LangChain, OpenAI and the tools are imported where they are used, so importing
+# this module stays cheap for callers that never build an agent
+import asyncio
 import os
-from langchain.agents import initialize_agent, AgentType
-from langchain_openai import ChatOpenAI
-from langchain.memory import ConversationBufferMemory
-from langchain.schema import BaseMessage
-from tools import StatsTool, ScheduleTool, StandingsTool, RosterTool, ArenaTool
+import time
+import re
+import threading
+from collections import OrderedDict
+from functools import lru_cache
 
-def build_agent():
-    llm = ChatOpenAI(model="gpt-4o-mini", temperature=0)
+# The planner asks for plan and answer in one agent run and splits the reply
+_PLAN_AND_ANSWER_PROMPT = (
+    "First outline a short numbered plan for answering the question, then execute it.\n\n"
+    "Question: {question}\n\n"
+    "Respond as:\nPLAN:\n<numbered steps>\nANSWER:\n<final answer>"
+)
+_PLAN_AND_ANSWER_RE = re.compile(r"PLAN:\s*(.*?)\s*ANSWER:\s*(.*)", re.S)
 
-    # Conversation memory allows the agent to maintain context across turns
-    memory = ConversationBufferMemory(memory_key="chat_history", return_messages=True)
+# Executor settings that are the same for every agent
+_AGENT_OPTIONS = {
+    "verbose": True,  # Enable verbose mode to see what's happening
+    "max_iterations": 5,  # Increase iteration limit
+    "max_execution_time": 30,  # Set execution time limit to 30 seconds
+    "early_stopping_method": "generate",  # Better stopping method
+    "handle_parsing_errors": True,  # Handle parsing errors gracefully
+}
+
+# Replies at temperature 0 are repeatable, so repeated questions are answered
+# from a bounded LRU instead of another agent run
+_ANSWER_CACHE_SIZE = 512
+_answer_cache = OrderedDict()
+_answer_lock = threading.Lock()
+_answer_hits = 0
+_answer_misses = 0
+_MISSING = object()
+
+@lru_cache(maxsize=1)
+def _cached_llm():
+    # One client per process: agents and planners share its connection pool
+    from langchain_openai import ChatOpenAI
+    return ChatOpenAI(model="gpt-4o-mini", temperature=0)
+
+@lru_cache(maxsize=1)
+def _get_tools():
+    # The tools hold no per-conversation state, so one set serves every agent
+    from tools import StatsTool, ScheduleTool, StandingsTool, RosterTool, ArenaTool
+    return (StatsTool(), ScheduleTool(), StandingsTool(), RosterTool(), ArenaTool())
+
+def _answer_cache_enabled() -> bool:
+    # Read like every other boolean flag, so "1", "yes" and "on" also disable it
+    from config import _parse_bool
+    return not _parse_bool(os.getenv("NBA_AGENT_DISABLE_ANSWER_CACHE", "false"))
+
+def _lookup_answer(prompt: str):
+    global _answer_hits, _answer_misses
+    with _answer_lock:
+        if prompt in _answer_cache:
+            _answer_hits += 1
+            _answer_cache.move_to_end(prompt)
+            return _answer_cache[prompt]
+        _answer_misses += 1
+    return _MISSING
+
+def _store_answer(prompt: str, output: str) -> None:
+    with _answer_lock:
+        _answer_cache[prompt] = output
+        while len(_answer_cache) > _ANSWER_CACHE_SIZE:
+            _answer_cache.popitem(last=False)
+
+def _cached_invoke(agent, prompt: str) -> str:
+    if not _answer_cache_enabled():
+        return agent.invoke({"input": prompt}).get("output", "")
+    output = _lookup_answer(prompt)
+    if output is _MISSING:
+        output = agent.invoke({"input": prompt}).get("output", "")
+        _store_answer(prompt, output)
+    return output
+
+async def _cached_ainvoke(agent, prompt: str) -> str:
+    if not _answer_cache_enabled():
+        return (await agent.ainvoke({"input": prompt})).get("output", "")
+    output = _lookup_answer(prompt)
+    if output is _MISSING:
+        output = (await agent.ainvoke({"input": prompt})).get("output", "")
+        _store_answer(prompt, output)
+    return output
+
+async def abatch_invoke(agent, questions, max_concurrency=None) -> list:
+    """
+    Run many questions through one agent concurrently on the event loop.
+    
+    At most max_concurrency requests are in flight (default: the configured
+    max_concurrent_requests). Returns one (result, seconds) pair per question,
+    in order, where result is the output text or the exception raised.
+    """
+    if max_concurrency is None:
+        from config import get_config
+        max_concurrency = get_config().api.max_concurrent_requests
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def run_one(question):
+        async with semaphore:
+            start = time.perf_counter()
+            try:
+                response = await agent.ainvoke({"input": question})
+                result = response.get("output", str(response))
+            except Exception as e:
+                result = e
+            return result, time.perf_counter() - start
+
+    return await asyncio.gather(*(run_one(question) for question in questions))
+
+def get_answer_cache_stats() -> dict:
+    """Hit/miss counters and current size of the answer cache."""
+    with _answer_lock:
+        lookups = _answer_hits + _answer_misses
+        return {
+            "hits": _answer_hits,
+            "misses": _answer_misses,
+            "size": len(_answer_cache),
+            "max_size": _ANSWER_CACHE_SIZE,
+            "hit_ratio": _answer_hits / lookups if lookups else 0.0,
+        }
+
+@lru_cache(maxsize=1)
+def _get_tracer():
+    # judgeval is only imported, and the tracer built, once a key is present
+    from judgeval.common.tracer import Tracer
+    return Tracer(project_name="nba_agent", deep_tracing=False)
+
+def build_agent(stateful: bool = True):
+    from langchain.agents import initialize_agent, AgentType
+
+    llm = _cached_llm()
 
     # Initialize agent without tracer if Judgment credentials are missing
     agent_kwargs = {
-        "tools": [StatsTool(), ScheduleTool(), StandingsTool(), RosterTool(), ArenaTool()],
+        **_AGENT_OPTIONS,
+        "tools": list(_get_tools()),  # a fresh list, in case LangChain mutates it
         "llm": llm,
         "agent": AgentType.CHAT_ZERO_SHOT_REACT_DESCRIPTION,
-        "verbose": True,  # Enable verbose mode to see what's happening
-        "max_iterations": 5,  # Increase iteration limit
-        "max_execution_time": 30,  # Set execution time limit to 30 seconds
-        "early_stopping_method": "generate",  # Better stopping method
-        "handle_parsing_errors": True,  # Handle parsing errors gracefully
-        "memory": memory,
     }
+
+    if stateful:
+        from langchain.memory import ConversationBufferMemory
+
+        # Conversation memory allows the agent to maintain context across turns.
+        # Unlike the LLM and tools it is per agent, so conversations stay separate
+        agent_kwargs["memory"] = ConversationBufferMemory(memory_key="chat_history", return_messages=True)
     
     # Add tracer only if Judgment API key is available
-    try:
-        from judgeval.common.tracer import Tracer
-        if os.getenv("JUDGMENT_API_KEY"):
-            tracer = Tracer(project_name="nba_agent", deep_tracing=False)
-            agent_kwargs["tracer"] = tracer
+    if os.environ.get("JUDGMENT_API_KEY"):
+        try:
+            agent_kwargs["tracer"] = _get_tracer()
             print("✅ Judgment tracing enabled")
-        else:
-            print("⚠️  Running without Judgment tracing (no API key found)")
-    except Exception as e:
-        print(f"⚠️  Running without Judgment tracing: {e}")
+        except Exception as e:
+            print(f"⚠️  Running without Judgment tracing: {e}")
+    else:
+        print("⚠️  Running without Judgment tracing (no API key found)")
     
     return initialize_agent(**agent_kwargs)
 
 
+def _message_text(resp) -> str:
+    # resp can be a message or string depending on llm implementation
+    content = getattr(resp, "content", None)
+    if content is not None:
+        return content
+    return str(resp)
+
+
 class PlanningAgent:
     """Wrapper agent that generates a plan before answering."""
 
     def __init__(self):
-        self.llm = ChatOpenAI(model="gpt-4o-mini", temperature=0)
-        self.base_agent = build_agent()
+        self.llm = _cached_llm()
+        # Each planner question is answered on its own, so no history is kept
+        self.base_agent = build_agent(stateful=False)
 
-    def _generate_plan(self, question: str) -> str:
+    def _plan_prompt(self, question: str) -> str:
         prompt = (
             "You are an NBA assistant planning a strategy to answer the user's question. "
             "Break the question into short numbered steps."
         )
-        resp = self.llm.invoke(f"{prompt}\nQuestion: {question}\nPlan:")
-        # resp can be a message or string depending on llm implementation
-        if isinstance(resp, BaseMessage):
-            return resp.content
-        return str(resp)
+        return f"{prompt}\nQuestion: {question}\nPlan:"
+
+    def _generate_plan(self, question: str) -> str:
+        return _message_text(self.llm.invoke(self._plan_prompt(question)))
+
+    def _split_reply(self, output: str):
+        match = _PLAN_AND_ANSWER_RE.search(output)
+        if match:
+            return match.group(1), match.group(2).strip()
+        return None, output
 
     def invoke(self, inputs: dict):
         question = inputs.get("input", "")
-        plan = self._generate_plan(question)
-        answer = self.base_agent.invoke({"input": question}).get("output", "")
+        prompt = _PLAN_AND_ANSWER_PROMPT.format(question=question)
+        plan, answer = self._split_reply(_cached_invoke(self.base_agent, prompt))
+        if plan is None:
+            # The agent ignored the format: keep its reply and plan separately
+            plan = self._generate_plan(question)
+        return {"plan": plan, "answer": answer}
+
+    async def ainvoke(self, inputs: dict):
+        question = inputs.get("input", "")
+        prompt = _PLAN_AND_ANSWER_PROMPT.format(question=question)
+        plan, answer = self._split_reply(await _cached_ainvoke(self.base_agent, prompt))
+        if plan is None:
+            plan = _message_text(await self.llm.ainvoke(self._plan_prompt(question)))
         return {"plan": plan, "answer": answer}
 
     def run(self, question: str) -> str:
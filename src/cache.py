@@ -1,30 +1,118 @@
 """Simple disk and memory cache utilities."""
+import atexit
 import json
 import hashlib
+import os
+import queue
+import threading
+from collections import OrderedDict
+from functools import lru_cache
 from pathlib import Path
 
+from logger import get_logger
+
+try:
+    import orjson
+except ImportError:  # stdlib json is the portable fallback
+    orjson = None
+
+logger = get_logger(__name__)
+
 CACHE_DIR = Path("cache")
 CACHE_DIR.mkdir(exist_ok=True)
 
-_memory_cache = {}
+# In-memory layer, bounded and evicted least-recently-used first
+_MEMORY_CACHE_SIZE = int(os.getenv("NBA_AGENT_MEMORY_CACHE_SIZE", "1024"))
+_memory_cache = OrderedDict()
+_memory_lock = threading.Lock()
+_hits = 0
+_misses = 0
+
+# Disk writes are queued and performed by a background writer thread
+_write_queue = queue.Queue()
 
-__all__ = ["get", "set", "_path_for_key"]
+__all__ = ["get", "set", "flush", "get_stats", "_path_for_key"]
 
+@lru_cache(maxsize=4096)
 def _path_for_key(key: str) -> Path:
+    # Keys repeat constantly, so each one is hashed once per process. The MD5
+    # naming is kept so existing cache files stay addressable.
     hashed = hashlib.md5(key.encode()).hexdigest()
     return CACHE_DIR / f"{hashed}.json"
 
-def get(key: str):
-    if key in _memory_cache:
-        return _memory_cache[key]
-    path = _path_for_key(key)
-    if path.exists():
-        data = json.loads(path.read_text())
+def _dumps(data) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(data).encode()
+
+def _loads(raw: bytes):
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+def _remember(key: str, data) -> None:
+    with _memory_lock:
         _memory_cache[key] = data
-        return data
-    return None
+        _memory_cache.move_to_end(key)
+        while len(_memory_cache) > _MEMORY_CACHE_SIZE:
+            _memory_cache.popitem(last=False)
+
+def get_stats() -> dict:
+    """Hit/miss counters and current size of the in-memory layer."""
+    with _memory_lock:
+        lookups = _hits + _misses
+        return {
+            "hits": _hits,
+            "misses": _misses,
+            "size": len(_memory_cache),
+            "max_size": _MEMORY_CACHE_SIZE,
+            "hit_ratio": _hits / lookups if lookups else 0.0,
+        }
+
+def get(key: str):
+    global _hits, _misses
+    with _memory_lock:
+        if key in _memory_cache:
+            _hits += 1
+            _memory_cache.move_to_end(key)
+            return _memory_cache[key]
+        _misses += 1
+    try:
+        raw = _path_for_key(key).read_bytes()
+    except FileNotFoundError:
+        return None
+    data = _loads(raw)
+    _remember(key, data)
+    return data
+
+def _write_atomic(path: Path, payload: bytes) -> None:
+    # Write beside the target and rename over it, so readers never see a
+    # half-written file and a crash cannot leave a corrupt cache entry
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    tmp.write_bytes(payload)
+    os.replace(tmp, path)
+
+def _writer() -> None:
+    while True:
+        path, payload = _write_queue.get()
+        try:
+            _write_atomic(path, payload)
+        except OSError as e:
+            logger.warning(f"Failed to write cache file {path}: {e}")
+        finally:
+            _write_queue.task_done()
+
+threading.Thread(target=_writer, name="cache-writer", daemon=True).start()
+
+def flush() -> None:
+    """Block until every queued disk write has completed."""
+    _write_queue.join()
+
+# Pending writes still reach disk when the interpreter exits normally
+atexit.register(flush)
 
 def set(key: str, data) -> None:
-    path = _path_for_key(key)
-    path.write_text(json.dumps(data))
-    _memory_cache[key] = data
+    # Memory is updated immediately; the disk copy is written behind the caller.
+    # Encoding happens here so later mutation of `data` cannot change the file.
+    _remember(key, data)
+    _write_queue.put((_path_for_key(key), _dumps(data)))
@@ -5,6 +5,8 @@ Centralized configuration with environment variables and sensible defaults
 """
 
 import os
+import threading
+from operator import attrgetter
 from typing import Optional, Dict, Any
 from dataclasses import dataclass, field
 from pathlib import Path
@@ -83,65 +85,88 @@ class NBAAgentConfig:
     testing: bool = False
     environment: str = "production"
 
-def load_config() -> NBAAgentConfig:
-    """
-    Load configuration from environment variables with fallback to defaults
-    
-    Returns:
-        NBAAgentConfig instance with loaded configuration
-    """
-    config = NBAAgentConfig()
-    
+# Accepted spellings for an enabled boolean setting; anything else is false
+_TRUTHY = frozenset({"1", "true", "yes", "on", "t", "y"})
+
+def _parse_bool(value: str) -> bool:
+    return value.strip().lower() in _TRUTHY
+
+# (config attribute path, environment variable, parser). A variable that is not
+# set leaves the dataclass default in place.
+_ENV_SCHEMA = (
     # API Configuration
-    config.api.openai_api_key = os.getenv("OPENAI_API_KEY", "")
-    config.api.judgment_api_key = os.getenv("JUDGMENT_API_KEY")
-    config.api.judgment_org_id = os.getenv("JUDGMENT_ORG_ID")
-    config.api.request_timeout = int(os.getenv("NBA_AGENT_REQUEST_TIMEOUT", "30"))
-    config.api.max_retries = int(os.getenv("NBA_AGENT_MAX_RETRIES", "3"))
-    config.api.rate_limit_per_minute = int(os.getenv("NBA_AGENT_RATE_LIMIT", "100"))
-    config.api.max_concurrent_requests = int(os.getenv("NBA_AGENT_MAX_CONCURRENT", "10"))
+    ("api.openai_api_key", "OPENAI_API_KEY", str),
+    ("api.judgment_api_key", "JUDGMENT_API_KEY", str),
+    ("api.judgment_org_id", "JUDGMENT_ORG_ID", str),
+    ("api.request_timeout", "NBA_AGENT_REQUEST_TIMEOUT", int),
+    ("api.max_retries", "NBA_AGENT_MAX_RETRIES", int),
+    ("api.rate_limit_per_minute", "NBA_AGENT_RATE_LIMIT", int),
+    ("api.max_concurrent_requests", "NBA_AGENT_MAX_CONCURRENT", int),
     
     # Cache Configuration
-    config.cache.ttl_seconds = int(os.getenv("NBA_AGENT_CACHE_TTL", "3600"))
-    config.cache.cache_dir = os.getenv("NBA_AGENT_CACHE_DIR", "cache")
-    config.cache.max_cache_size_mb = int(os.getenv("NBA_AGENT_MAX_CACHE_SIZE_MB", "100"))
-    config.cache.enable_memory_cache = os.getenv("NBA_AGENT_ENABLE_MEMORY_CACHE", "true").lower() == "true"
-    config.cache.enable_disk_cache = os.getenv("NBA_AGENT_ENABLE_DISK_CACHE", "true").lower() == "true"
+    ("cache.ttl_seconds", "NBA_AGENT_CACHE_TTL", int),
+    ("cache.cache_dir", "NBA_AGENT_CACHE_DIR", str),
+    ("cache.max_cache_size_mb", "NBA_AGENT_MAX_CACHE_SIZE_MB", int),
+    ("cache.enable_memory_cache", "NBA_AGENT_ENABLE_MEMORY_CACHE", _parse_bool),
+    ("cache.enable_disk_cache", "NBA_AGENT_ENABLE_DISK_CACHE", _parse_bool),
     
     # Logging Configuration
-    config.logging.level = os.getenv("NBA_AGENT_LOG_LEVEL", "INFO").upper()
-    config.logging.format = os.getenv("LOG_FORMAT", "colored")
-    config.logging.log_file = os.getenv("NBA_AGENT_LOG_FILE")
-    config.logging.max_log_file_size_mb = int(os.getenv("NBA_AGENT_MAX_LOG_SIZE_MB", "10"))
-    config.logging.log_rotation_count = int(os.getenv("NBA_AGENT_LOG_ROTATION_COUNT", "5"))
+    ("logging.level", "NBA_AGENT_LOG_LEVEL", str.upper),
+    ("logging.format", "LOG_FORMAT", str),
+    ("logging.log_file", "NBA_AGENT_LOG_FILE", str),
+    ("logging.max_log_file_size_mb", "NBA_AGENT_MAX_LOG_SIZE_MB", int),
+    ("logging.log_rotation_count", "NBA_AGENT_LOG_ROTATION_COUNT", int),
     
     # Security Configuration
-    config.security.enable_input_validation = os.getenv("NBA_AGENT_ENABLE_VALIDATION", "true").lower() == "true"
-    config.security.enable_rate_limiting = os.getenv("API_RATE_LIMIT_ENABLED", "true").lower() == "true"
-    config.security.max_query_length = int(os.getenv("NBA_AGENT_MAX_QUERY_LENGTH", "500"))
-    config.security.max_player_name_length = int(os.getenv("NBA_AGENT_MAX_PLAYER_NAME_LENGTH", "50"))
-    config.security.max_team_name_length = int(os.getenv("NBA_AGENT_MAX_TEAM_NAME_LENGTH", "50"))
-    config.security.enable_request_sanitization = os.getenv("NBA_AGENT_ENABLE_SANITIZATION", "true").lower() == "true"
+    ("security.enable_input_validation", "NBA_AGENT_ENABLE_VALIDATION", _parse_bool),
+    ("security.enable_rate_limiting", "API_RATE_LIMIT_ENABLED", _parse_bool),
+    ("security.max_query_length", "NBA_AGENT_MAX_QUERY_LENGTH", int),
+    ("security.max_player_name_length", "NBA_AGENT_MAX_PLAYER_NAME_LENGTH", int),
+    ("security.max_team_name_length", "NBA_AGENT_MAX_TEAM_NAME_LENGTH", int),
+    ("security.enable_request_sanitization", "NBA_AGENT_ENABLE_SANITIZATION", _parse_bool),
     
     # Performance Configuration
-    config.performance.enable_async = os.getenv("NBA_AGENT_ENABLE_ASYNC", "false").lower() == "true"
-    config.performance.connection_pool_size = int(os.getenv("NBA_AGENT_POOL_SIZE", "10"))
-    config.performance.enable_compression = os.getenv("NBA_AGENT_ENABLE_COMPRESSION", "true").lower() == "true"
-    config.performance.query_timeout_seconds = int(os.getenv("NBA_AGENT_QUERY_TIMEOUT", "30"))
-    config.performance.enable_performance_monitoring = os.getenv("NBA_AGENT_ENABLE_MONITORING", "true").lower() == "true"
+    ("performance.enable_async", "NBA_AGENT_ENABLE_ASYNC", _parse_bool),
+    ("performance.connection_pool_size", "NBA_AGENT_POOL_SIZE", int),
+    ("performance.enable_compression", "NBA_AGENT_ENABLE_COMPRESSION", _parse_bool),
+    ("performance.query_timeout_seconds", "NBA_AGENT_QUERY_TIMEOUT", int),
+    ("performance.enable_performance_monitoring", "NBA_AGENT_ENABLE_MONITORING", _parse_bool),
     
     # Streamlit Configuration
-    config.streamlit.server_port = int(os.getenv("STREAMLIT_SERVER_PORT", "8501"))
-    config.streamlit.server_address = os.getenv("STREAMLIT_SERVER_ADDRESS", "localhost")
-    config.streamlit.max_upload_size_mb = int(os.getenv("STREAMLIT_MAX_UPLOAD_SIZE_MB", "200"))
-    config.streamlit.enable_cors = os.getenv("STREAMLIT_ENABLE_CORS", "false").lower() == "true"
-    config.streamlit.theme = os.getenv("STREAMLIT_THEME", "dark")
+    ("streamlit.server_port", "STREAMLIT_SERVER_PORT", int),
+    ("streamlit.server_address", "STREAMLIT_SERVER_ADDRESS", str),
+    ("streamlit.max_upload_size_mb", "STREAMLIT_MAX_UPLOAD_SIZE_MB", int),
+    ("streamlit.enable_cors", "STREAMLIT_ENABLE_CORS", _parse_bool),
+    ("streamlit.theme", "STREAMLIT_THEME", str),
     
     # General Settings
-    config.debug = os.getenv("DEBUG", "false").lower() == "true"
-    config.development_mode = os.getenv("DEVELOPMENT_MODE", "false").lower() == "true"
-    config.testing = os.getenv("TESTING", "false").lower() == "true"
-    config.environment = os.getenv("ENVIRONMENT", "production")
+    ("debug", "DEBUG", _parse_bool),
+    ("development_mode", "DEVELOPMENT_MODE", _parse_bool),
+    ("testing", "TESTING", _parse_bool),
+    ("environment", "ENVIRONMENT", str),
+)
+
+# Split once: (section getter or None for top-level settings, attribute, variable, parser)
+_ENV_FIELDS = tuple(
+    (attrgetter(path.rpartition(".")[0]) if "." in path else None,
+     path.rpartition(".")[2], env_var, parse)
+    for path, env_var, parse in _ENV_SCHEMA
+)
+
+def load_config() -> NBAAgentConfig:
+    """
+    Load configuration from environment variables with fallback to defaults
+    
+    Returns:
+        NBAAgentConfig instance with loaded configuration
+    """
+    config = NBAAgentConfig()
+    environ = os.environ
+    
+    for section, name, env_var, parse in _ENV_FIELDS:
+        raw = environ.get(env_var)
+        if raw is not None:
+            setattr(section(config) if section else config, name, parse(raw))
     
     return config
 
@@ -229,7 +254,9 @@ NBA_AGENT_CACHE_TTL=3600              # Cache timeout in seconds (1 hour)
 NBA_AGENT_CACHE_DIR=cache             # Cache directory
 NBA_AGENT_MAX_CACHE_SIZE_MB=100       # Maximum cache size in MB
 NBA_AGENT_ENABLE_MEMORY_CACHE=true    # Enable in-memory caching
+NBA_AGENT_MEMORY_CACHE_SIZE=1024      # Max entries held in memory (LRU)
 NBA_AGENT_ENABLE_DISK_CACHE=true      # Enable disk caching
+NBA_AGENT_DISABLE_ANSWER_CACHE=false  # Re-run the agent for repeated planner questions
 
 # Logging Settings
 NBA_AGENT_LOG_LEVEL=INFO              # Logging level (DEBUG, INFO, WARNING, ERROR)
@@ -270,6 +297,7 @@ ENVIRONMENT=production                # Environment (development, staging, produ
 
 # Global configuration instance
 _config: Optional[NBAAgentConfig] = None
+_config_lock = threading.Lock()
 
 def get_config() -> NBAAgentConfig:
     """
@@ -279,8 +307,11 @@ def get_config() -> NBAAgentConfig:
         NBAAgentConfig instance
     """
     global _config
+    # Double-checked so the common already-loaded path takes no lock
     if _config is None:
-        _config = load_config()
+        with _config_lock:
+            if _config is None:
+                _config = load_config()
     return _config
 
 def reload_config() -> NBAAgentConfig:
@@ -5,37 +5,246 @@ Provides natural language understanding and improved user experience
 """
 
 import os
+import re
 import json
-from langchain.agents import initialize_agent, AgentType
-from langchain_openai import ChatOpenAI
-from langchain.memory import ConversationBufferMemory
-from langchain.schema import BaseMessage
+import asyncio
+from functools import lru_cache
+from importlib.util import find_spec
+from types import MappingProxyType
+from typing import Any, Mapping, Tuple
 from enhanced_tools import EnhancedStatsTool, EnhancedScheduleTool
-from query_parser import query_parser, query_enhancer, ParsedQuery, QueryType
+from query_parser import parse_cached, query_enhancer, ParsedQuery, QueryType
 from logger import get_logger
+from semantic_cache import SemanticCache
+
+try:
+    import orjson
+except ImportError:  # stdlib json is the portable fallback
+    orjson = None
 
 logger = get_logger(__name__)
 
+# Pronouns and elliptical openers mark a question that leans on earlier turns
+_FOLLOW_UP_RE = re.compile(
+    r"\b(?:he|him|his|she|her|they|them|their|it|its|that|those)\b"
+    r"|^(?:and|also|what about|how about|same)\b"
+)
+
+# Example queries by category, shared read-only by every agent
+_QUERY_EXAMPLES = MappingProxyType({
+    "player_stats": (
+        "What are LeBron's stats this season?",
+        "How many points does Curry average?",
+        "Show me Giannis' shooting percentages",
+        "Embiid rebounds and assists"
+    ),
+    "comparisons": (
+        "Compare LeBron and Curry",
+        "Who's better: Giannis or Embiid?",
+        "LeBron vs Durant stats",
+        "Jokic vs Luka comparison"
+    ),
+    "team_info": (
+        "When do the Warriors play next?",
+        "Lakers schedule this week",
+        "Celtics upcoming games",
+        "Heat next game"
+    ),
+    "advanced": (
+        "LeBron's shooting efficiency this season",
+        "Curry's detailed stats with games played",
+        "Giannis vs Embiid head to head",
+        "Show me visual charts for LeBron's performance"
+    )
+})
+
+# Help text by query category, shared read-only by every processor
+_QUERY_HELP = MappingProxyType({
+    "player_stats": MappingProxyType({
+        "description": "Get player statistics and performance data",
+        "examples": (
+            "LeBron's points this season",
+            "Curry shooting percentages",
+            "Giannis assists and rebounds",
+            "Embiid stats now"
+        ),
+        "tips": (
+            "Use first names for common players (LeBron, Curry, Giannis)",
+            "Specify stat types: points, assists, rebounds, shooting",
+            "Add 'this season' or 'last season' for specific time periods"
+        )
+    }),
+    "comparisons": MappingProxyType({
+        "description": "Compare players head-to-head",
+        "examples": (
+            "Compare LeBron and Curry",
+            "Giannis vs Embiid",
+            "Who's better: Luka or Jokic?",
+            "LeBron vs Durant stats"
+        ),
+        "tips": (
+            "Use 'vs', 'versus', or 'compare' for comparisons",
+            "Compare specific stats: 'LeBron vs Curry shooting'",
+            "Ask 'who's better' for overall comparisons"
+        )
+    }),
+    "team_info": MappingProxyType({
+        "description": "Get team schedules and information",
+        "examples": (
+            "When do the Warriors play next?",
+            "Lakers schedule this week",
+            "Celtics upcoming games",
+            "Heat next game"
+        ),
+        "tips": (
+            "Use team names or abbreviations (Warriors, GSW)",
+            "Ask about 'next game', 'schedule', or 'upcoming'",
+            "Specify time periods: 'this week', 'next week'"
+        )
+    })
+})
+
+def _sse(payload: dict) -> bytes:
+    """Format one server-sent event, already encoded for the wire"""
+    if orjson is not None:
+        return b"data: " + orjson.dumps(payload, option=orjson.OPT_NON_STR_KEYS) + b"\n\n"
+    return f"data: {json.dumps(payload)}\n\n".encode()
+
 class EnhancedNBAAgent:
     """Enhanced NBA Agent with flexible query parsing and natural language understanding"""
     
-    def __init__(self):
-        self.llm = ChatOpenAI(model="gpt-4o-mini", temperature=0)
-        self.memory = ConversationBufferMemory(memory_key="chat_history", return_messages=True)
-        self.query_parser = query_parser
-        self.query_enhancer = query_enhancer
+    __slots__ = (
+        "max_token_limit", "response_cache", "stats_tool", "schedule_tool", "tools",
+        "_http", "_http_loop", "_llm", "_memory", "_agent", "_stateless_agent"
+    )
+    
+    _VISUAL_SUGGESTIONS = {
+        QueryType.PLAYER_STATS: (
+            "📊 Bar chart of key stats",
+            "📈 Trend line of performance over time",
+            "🎯 Radar chart of shooting percentages"
+        ),
+        QueryType.PLAYER_COMPARISON: (
+            "⚖️ Side-by-side comparison chart",
+            "📊 Radar chart comparison",
+            "📈 Performance trend comparison"
+        )
+    }
+    
+    _FALLBACK_SUGGESTIONS = (
+        "Try asking about a specific player: 'LeBron James stats'",
+        "Ask about team schedules: 'When do the Warriors play next?'",
+        "Compare players: 'LeBron vs Curry'",
+        "Get shooting stats: 'Curry shooting percentages'"
+    )
+    
+    def __init__(self, max_token_limit: int = 1500):
+        # Chat history kept in the prompt is trimmed to this many tokens
+        self.max_token_limit = max_token_limit
+        # Answers keyed by query text alone; only self-contained questions,
+        # which are answered without chat history, are cached
+        self.response_cache = SemanticCache()
         
-        # Initialize tools
-        self.tools = [
-            EnhancedStatsTool(),
-            EnhancedScheduleTool()
-        ]
+        # Initialize tools; SmartQueryProcessor reuses these for direct queries
+        self.stats_tool = EnhancedStatsTool()
+        self.schedule_tool = EnhancedScheduleTool()
+        self.tools = [self.stats_tool, self.schedule_tool]
         
-        # Initialize agent
-        self.agent = self._build_agent()
+        # The LLM client, memory and agent executor are built on first use, so
+        # queries answered directly from the tools never import or construct them
+        self._http = None
+        self._http_loop = None
+        self._llm = None
+        self._memory = None
+        self._agent = None
+        self._stateless_agent = None
+    
+    @property
+    def llm(self):
+        if self._llm is None:
+            import httpx
+            from langchain_openai import ChatOpenAI
+            
+            # One pooled client for every async model call this agent makes;
+            # HTTP/2 multiplexes concurrent calls when the h2 package is installed
+            self._http = httpx.AsyncClient(
+                http2=find_spec("h2") is not None,
+                limits=httpx.Limits(max_connections=100, max_keepalive_connections=50)
+            )
+            self._llm = ChatOpenAI(model="gpt-4o-mini", temperature=0, http_async_client=self._http)
+        return self._llm
+    
+    def _bind_loop(self):
+        """Tie the pooled client to the running event loop.
+        
+        httpx connections belong to the loop that opened them, so when a later
+        asyncio.run() calls in on a new loop the client, model and executor are
+        rebuilt; the conversation memory is kept.
+        """
+        loop = asyncio.get_running_loop()
+        if self._http_loop is not loop:
+            if self._http_loop is not None:
+                self._http = self._llm = self._agent = self._stateless_agent = None
+            self._http_loop = loop
+    
+    async def aclose(self):
+        """Close the pooled HTTP client; async model calls fail after this"""
+        if self._http is not None:
+            await self._http.aclose()
+    
+    @property
+    def memory(self):
+        if self._memory is None:
+            from langchain.memory import ConversationTokenBufferMemory
+            self._memory = ConversationTokenBufferMemory(
+                llm=self.llm,
+                memory_key="chat_history",
+                return_messages=True,
+                max_token_limit=self.max_token_limit
+            )
+        return self._memory
+    
+    def _is_self_contained(self, query: str) -> bool:
+        """Whether a query can be answered without the chat history.
+        
+        Such queries run on the memory-free executor, so their replies depend on
+        the query text alone and may be cached under it.
+        """
+        return _FOLLOW_UP_RE.search(query.strip().lower()) is None
+    
+    def _remember(self, query: str, response: dict) -> None:
+        """Record a turn answered outside the memory-backed executor"""
+        self.memory.save_context({"input": query}, {"output": response["output"]})
+    
+    def _cached_response(self, query: str):
+        """Cached answer to a self-contained query, else None
+        
+        A hit is still recorded in memory so a follow-up can refer to it.
+        """
+        if not self._is_self_contained(query):
+            return None
+        cached = self.response_cache.get(query)
+        if cached is not None:
+            self._remember(query, cached)
+        return cached
+    
+    @property
+    def agent(self):
+        if self._agent is None:
+            self._agent = self._build_agent()
+        return self._agent
     
-    def _build_agent(self):
+    @property
+    def stateless_agent(self):
+        """Executor without conversation memory, for self-contained queries"""
+        if self._stateless_agent is None:
+            self._stateless_agent = self._build_agent(with_memory=False)
+        return self._stateless_agent
+    
+    def _build_agent(self, with_memory: bool = True):
         """Build the enhanced agent with better configuration"""
+        from langchain.agents import initialize_agent, AgentType
+        
         agent_kwargs = {
             "tools": self.tools,
             "llm": self.llm,
@@ -45,13 +254,14 @@ class EnhancedNBAAgent:
             "max_execution_time": 45,  # More time for parsing
             "early_stopping_method": "generate",
             "handle_parsing_errors": True,
-            "memory": self.memory,
         }
+        if with_memory:
+            agent_kwargs["memory"] = self.memory
         
         # Add Judgment tracing if available
         try:
-            from judgeval.common.tracer import Tracer
             if os.getenv("JUDGMENT_API_KEY"):
+                from judgeval.common.tracer import Tracer
                 tracer = Tracer(project_name="enhanced_nba_agent", deep_tracing=False)
                 agent_kwargs["tracer"] = tracer
                 logger.info("✅ Judgment tracing enabled for enhanced agent")
@@ -66,154 +276,221 @@ class EnhancedNBAAgent:
         """Process a query with enhanced parsing and context awareness"""
         query = inputs.get("input", "")
         
+        # Repeated or rephrased questions skip parsing and the agent entirely
+        cached = self._cached_response(query)
+        if cached is not None:
+            return cached
+        stateless = self._is_self_contained(query)
+        
         try:
             # Parse the query to understand intent
-            parsed_query = self.query_parser.parse(query)
+            parsed_query = parse_cached(query.strip().lower())
             logger.info(f"Enhanced agent parsed query: {parsed_query}")
             
-            # Generate suggestions for similar queries
-            suggestions = self.query_enhancer.suggest_queries(parsed_query)
+            # Process with the agent; only follow-ups need the chat history
+            executor = self.stateless_agent if stateless else self.agent
+            response = executor.invoke({"input": query})
             
-            # Process with the agent
-            response = self.agent.invoke({"input": query})
+            return self._complete_response(query, parsed_query, response, stateless=stateless)
             
-            # Enhance response with context
-            enhanced_response = self._enhance_response(response, parsed_query, suggestions)
+        except Exception as e:
+            logger.error(f"Error in enhanced agent: {e}")
+            return self._error_response(query, e)
+    
+    async def ainvoke(self, inputs: dict) -> dict:
+        """Async invoke; parsing and suggestions run while the agent call is in flight"""
+        query = inputs.get("input", "")
+        
+        cached = self._cached_response(query)
+        if cached is not None:
+            return cached
+        stateless = self._is_self_contained(query)
+        
+        self._bind_loop()
+        executor = self.stateless_agent if stateless else self.agent
+        agent_task = asyncio.ensure_future(executor.ainvoke({"input": query}))
+        try:
+            # Let the agent task start its request before doing local work
+            await asyncio.sleep(0)
+            parsed_query = parse_cached(query.strip().lower())
+            logger.info(f"Enhanced agent parsed query: {parsed_query}")
+            suggestions = query_enhancer.suggest_queries(parsed_query)
             
-            return enhanced_response
+            response = await agent_task
+            
+            return self._complete_response(query, parsed_query, response, suggestions, stateless)
             
         except Exception as e:
+            agent_task.cancel()
             logger.error(f"Error in enhanced agent: {e}")
-            return {
-                "output": f"Sorry, I encountered an error processing your query: {str(e)}",
-                "error": True,
-                "suggestions": self._get_fallback_suggestions(query)
-            }
+            return self._error_response(query, e)
+    
+    def _complete_response(self, query: str, parsed_query: ParsedQuery, response: dict,
+                           suggestions: list = None, stateless: bool = False) -> dict:
+        """Enhance a finished agent response.
+        
+        Pass stateless=True when the memory-free executor produced the reply: it
+        then depends on the query alone, so it is cached under the query and
+        recorded in memory (the memory-backed executor records its own turns).
+        """
+        # Generate suggestions for similar queries
+        if suggestions is None:
+            suggestions = query_enhancer.suggest_queries(parsed_query)
+        
+        # Enhance response with context
+        enhanced_response = self._enhance_response(response, parsed_query, suggestions)
+        if stateless:
+            self.response_cache.set(query, enhanced_response)
+            self._remember(query, enhanced_response)
+        
+        return enhanced_response
+    
+    def _error_response(self, query: str, error: Exception) -> dict:
+        """Response returned when the agent fails on a query"""
+        return {
+            "output": f"Sorry, I encountered an error processing your query: {str(error)}",
+            "error": True,
+            "suggestions": self._get_fallback_suggestions(query)
+        }
+    
+    async def ainvoke_stream(self, inputs: dict):
+        """
+        Stream the reply as server-sent events
+        
+        Yields encoded events: a `{"token": ...}` event for each model token as
+        it is generated, then a final `{"done": true, ...}` event carrying the
+        same fields that invoke() returns (output, parsed_query, suggestions,
+        ...). Serve it with media type text/event-stream and proxy buffering
+        disabled.
+        """
+        query = inputs.get("input", "")
+        
+        cached = self._cached_response(query)
+        if cached is not None:
+            yield _sse({"token": cached["output"]})
+            yield _sse({"done": True, **cached})
+            return
+        stateless = self._is_self_contained(query)
+        
+        try:
+            parsed_query = parse_cached(query.strip().lower())
+            suggestions = query_enhancer.suggest_queries(parsed_query)
+            
+            root_run_id = None
+            response = {}
+            self._bind_loop()
+            executor = self.stateless_agent if stateless else self.agent
+            async for event in executor.astream_events({"input": query}, version="v2"):
+                if root_run_id is None:
+                    root_run_id = event["run_id"]
+                kind = event["event"]
+                if kind == "on_chat_model_stream":
+                    delta = event["data"]["chunk"].content
+                    if delta:
+                        yield _sse({"token": delta})
+                elif kind == "on_chain_end" and event["run_id"] == root_run_id:
+                    response = event["data"].get("output") or {}
+            
+            enhanced_response = self._enhance_response(response, parsed_query, suggestions)
+            if stateless:
+                self.response_cache.set(query, enhanced_response)
+                self._remember(query, enhanced_response)
+            yield _sse({"done": True, **enhanced_response})
+            
+        except Exception as e:
+            logger.error(f"Error in enhanced agent stream: {e}")
+            yield _sse({"done": True, **self._error_response(query, e)})
     
     def _enhance_response(self, response: dict, parsed_query: ParsedQuery, suggestions: list) -> dict:
         """Enhance the agent response with additional context and suggestions"""
+        ctx = parsed_query.context
+        stat_type = parsed_query.stat_type
+        urgent = ctx.get("urgent")
+        output = response.get("output", "")
+        
         enhanced = {
-            "output": response.get("output", ""),
+            "output": f"🚨 {output}" if urgent else output,
             "parsed_query": {
                 "query_type": parsed_query.query_type.value,
                 "entities": parsed_query.entities,
-                "stat_type": parsed_query.stat_type.value if parsed_query.stat_type else None,
+                "stat_type": stat_type.value if stat_type else None,
                 "season": parsed_query.season,
                 "comparison": parsed_query.comparison,
-                "context": parsed_query.context
+                "context": ctx
             },
             "suggestions": suggestions,
             "query_confidence": self._calculate_confidence(parsed_query)
         }
         
         # Add context-specific enhancements
-        if parsed_query.context.get("urgent"):
+        if urgent:
             enhanced["urgent"] = True
-            enhanced["output"] = f"🚨 {enhanced['output']}"
-        
-        if parsed_query.context.get("detailed"):
+        if ctx.get("detailed"):
             enhanced["detailed"] = True
-        
-        if parsed_query.context.get("visual"):
+        if ctx.get("visual"):
             enhanced["visual_suggestions"] = self._get_visual_suggestions(parsed_query)
         
         return enhanced
     
     def _calculate_confidence(self, parsed_query: ParsedQuery) -> float:
         """Calculate confidence score for the parsed query"""
-        confidence = 0.5  # Base confidence
-        
-        # Boost confidence for clear entities
-        if parsed_query.entities:
-            confidence += 0.2
-        
-        # Boost for specific stat types
-        if parsed_query.stat_type and parsed_query.stat_type != "all":
-            confidence += 0.1
-        
-        # Boost for specific seasons
-        if parsed_query.season and parsed_query.season != "2024-25":
-            confidence += 0.1
-        
-        # Boost for comparison queries
-        if parsed_query.comparison:
-            confidence += 0.1
-        
-        return min(confidence, 1.0)
+        # Base 0.5, +0.2 for clear entities, +0.1 each for a specific stat type,
+        # a non-default season and a comparison. Terms are added in that order
+        # so the float result is unchanged; the most it can reach is
+        # 0.9999999999999999, so no clamp to 1.0 is needed.
+        return (0.5
+                + 0.2 * bool(parsed_query.entities)
+                + 0.1 * bool(parsed_query.stat_type and parsed_query.stat_type != "all")
+                + 0.1 * bool(parsed_query.season and parsed_query.season != "2024-25")
+                + 0.1 * bool(parsed_query.comparison))
     
     def _get_visual_suggestions(self, parsed_query: ParsedQuery) -> list:
         """Get suggestions for visual representations"""
-        suggestions = []
-        
-        if parsed_query.query_type == QueryType.PLAYER_STATS:
-            suggestions.extend([
-                "📊 Bar chart of key stats",
-                "📈 Trend line of performance over time",
-                "🎯 Radar chart of shooting percentages"
-            ])
-        elif parsed_query.query_type == QueryType.PLAYER_COMPARISON:
-            suggestions.extend([
-                "⚖️ Side-by-side comparison chart",
-                "📊 Radar chart comparison",
-                "📈 Performance trend comparison"
-            ])
-        
-        return suggestions
+        return list(self._VISUAL_SUGGESTIONS.get(parsed_query.query_type, ()))
     
     def _get_fallback_suggestions(self, query: str) -> list:
         """Get fallback suggestions when query fails"""
-        return [
-            "Try asking about a specific player: 'LeBron James stats'",
-            "Ask about team schedules: 'When do the Warriors play next?'",
-            "Compare players: 'LeBron vs Curry'",
-            "Get shooting stats: 'Curry shooting percentages'"
-        ]
-    
-    def get_query_examples(self) -> dict:
+        return list(self._FALLBACK_SUGGESTIONS)
+    
+    def get_query_examples(self) -> Mapping[str, Tuple[str, ...]]:
         """Get example queries for different categories"""
-        return {
-            "player_stats": [
-                "What are LeBron's stats this season?",
-                "How many points does Curry average?",
-                "Show me Giannis' shooting percentages",
-                "Embiid rebounds and assists"
-            ],
-            "comparisons": [
-                "Compare LeBron and Curry",
-                "Who's better: Giannis or Embiid?",
-                "LeBron vs Durant stats",
-                "Jokic vs Luka comparison"
-            ],
-            "team_info": [
-                "When do the Warriors play next?",
-                "Lakers schedule this week",
-                "Celtics upcoming games",
-                "Heat next game"
-            ],
-            "advanced": [
-                "LeBron's shooting efficiency this season",
-                "Curry's detailed stats with games played",
-                "Giannis vs Embiid head to head",
-                "Show me visual charts for LeBron's performance"
-            ]
-        }
+        return _QUERY_EXAMPLES
 
+@lru_cache(maxsize=1)
 def build_enhanced_agent() -> EnhancedNBAAgent:
-    """Create an enhanced NBA agent with flexible query parsing"""
+    """Create an enhanced NBA agent with flexible query parsing.
+    
+    The agent is built once per process and shared, including its conversation
+    memory and response cache; the cache only serves self-contained questions,
+    which are answered without that memory. Construct EnhancedNBAAgent() directly when a caller needs its own
+    memory.
+    """
     return EnhancedNBAAgent()
 
 class SmartQueryProcessor:
     """Processes queries with intelligent routing and enhancement"""
     
-    def __init__(self):
+    __slots__ = (
+        "enhanced_agent", "stats_tool", "schedule_tool",
+        "batch_size", "batch_delay_ms", "_pending", "_batch_worker"
+    )
+    
+    def __init__(self, batch_size: int = 5, batch_delay_ms: int = 25):
         self.enhanced_agent = build_enhanced_agent()
-        self.query_parser = query_parser
-        self.query_enhancer = query_enhancer
+        self.stats_tool = self.enhanced_agent.stats_tool
+        self.schedule_tool = self.enhanced_agent.schedule_tool
+        
+        # Agent-bound queries passed to aprocess_query are grouped into batches of
+        # up to batch_size, waiting at most batch_delay_ms for a batch to fill
+        self.batch_size = batch_size
+        self.batch_delay_ms = batch_delay_ms
+        self._pending = None
+        self._batch_worker = None
     
     def process_query(self, query: str) -> dict:
         """Process a query with smart routing and enhancement"""
         # Parse the query
-        parsed = self.query_parser.parse(query)
+        parsed = parse_cached(query.strip().lower())
         
         # Determine if this is a simple query that can be handled directly
         if self._is_simple_query(parsed):
@@ -222,86 +499,110 @@ class SmartQueryProcessor:
             # Use the enhanced agent for complex queries
             return self.enhanced_agent.invoke({"input": query})
     
+    async def aprocess_query(self, query: str) -> dict:
+        """Async process_query; concurrent agent-bound queries share one batch call"""
+        parsed = parse_cached(query.strip().lower())
+        loop = asyncio.get_running_loop()
+        
+        if self._is_simple_query(parsed):
+            # The direct path is a blocking tool call, so keep it off the loop
+            return await loop.run_in_executor(None, self._handle_simple_query, parsed)
+        
+        cached = self.enhanced_agent._cached_response(query)
+        if cached is not None:
+            return cached
+        
+        # Follow-ups need the conversation memory, which a batch cannot share
+        if not self.enhanced_agent._is_self_contained(query):
+            return await self.enhanced_agent.ainvoke({"input": query})
+        
+        # The worker belongs to the loop it was started on; start a new one if
+        # this is the first call or an earlier loop has since shut down
+        if self._batch_worker is None or self._batch_worker.done():
+            self._pending = asyncio.Queue()
+            self._batch_worker = loop.create_task(self._run_batches())
+        
+        future = loop.create_future()
+        await self._pending.put((query, parsed, future))
+        return await future
+    
+    async def _run_batches(self):
+        """Drain queued queries and answer each batch with one agent.abatch call"""
+        loop = asyncio.get_running_loop()
+        batch = []
+        try:
+            while True:
+                batch = [await self._pending.get()]
+                deadline = loop.time() + self.batch_delay_ms / 1000
+                while len(batch) < self.batch_size:
+                    timeout = deadline - loop.time()
+                    if timeout <= 0:
+                        break
+                    try:
+                        batch.append(await asyncio.wait_for(self._pending.get(), timeout))
+                    except asyncio.TimeoutError:
+                        break
+                
+                agent = self.enhanced_agent
+                agent._bind_loop()
+                try:
+                    responses = await agent.stateless_agent.abatch(
+                        [{"input": query} for query, _, _ in batch], return_exceptions=True
+                    )
+                except Exception as e:
+                    responses = [e] * len(batch)
+                
+                for (query, parsed, future), response in zip(batch, responses):
+                    if future.done():
+                        continue
+                    # One failing item must not stop the worker or strand the rest
+                    try:
+                        if isinstance(response, Exception):
+                            raise response
+                        future.set_result(agent._complete_response(query, parsed, response, stateless=True))
+                    except Exception as e:
+                        logger.error(f"Error in batched enhanced agent: {e}")
+                        future.set_result(agent._error_response(query, e))
+        finally:
+            # The worker is stopping (cancelled or failed): no caller may be left waiting
+            while not self._pending.empty():
+                batch.append(self._pending.get_nowait())
+            for _, _, future in batch:
+                if not future.done():
+                    future.cancel()
+    
     def _is_simple_query(self, parsed: ParsedQuery) -> bool:
         """Determine if a query is simple enough for direct processing"""
-        # Simple queries have clear entities and specific stat types
-        return (
-            len(parsed.entities) == 1 and
-            parsed.query_type in [QueryType.PLAYER_STATS, QueryType.TEAM_SCHEDULE] and
-            parsed.stat_type != "all" and
-            not parsed.comparison
-        )
+        # Decided once by the parser, see ParsedQuery.is_simple
+        return parsed.is_simple
     
     def _handle_simple_query(self, parsed: ParsedQuery) -> dict:
         """Handle simple queries directly without agent overhead"""
-        try:
-            if parsed.query_type == QueryType.PLAYER_STATS:
-                # Use the enhanced stats tool directly
-                tool = EnhancedStatsTool()
-                result = tool._run(f"{parsed.entities[0]} {parsed.stat_type.value} {parsed.season}")
-                return {
-                    "output": result,
-                    "direct_processing": True,
-                    "parsed_query": {
-                        "query_type": parsed.query_type.value,
-                        "entities": parsed.entities,
-                        "stat_type": parsed.stat_type.value,
-                        "season": parsed.season
-                    }
-                }
-            else:
-                # Fall back to agent for other query types
-                return self.enhanced_agent.invoke({"input": " ".join(parsed.entities)})
-        except Exception as e:
-            logger.error(f"Error in simple query processing: {e}")
-            return self.enhanced_agent.invoke({"input": " ".join(parsed.entities)})
-    
-    def get_query_help(self) -> dict:
-        """Get help information for different query types"""
+        entities = parsed.entities
+        stat_type = parsed.stat_type
+        if parsed.query_type != QueryType.PLAYER_STATS or not entities or stat_type is None:
+            # Fall back to agent for other query types and incomplete parses
+            return self.enhanced_agent.invoke({"input": " ".join(entities)})
+        
+        # Use the enhanced stats tool directly. The tool reports lookup and
+        # network failures in its JSON result rather than raising.
+        stat_val = stat_type.value
+        season = parsed.season
+        result = self.stats_tool._run_structured(entities[0], stat_val, season)
         return {
-            "player_stats": {
-                "description": "Get player statistics and performance data",
-                "examples": [
-                    "LeBron's points this season",
-                    "Curry shooting percentages",
-                    "Giannis assists and rebounds",
-                    "Embiid stats now"
-                ],
-                "tips": [
-                    "Use first names for common players (LeBron, Curry, Giannis)",
-                    "Specify stat types: points, assists, rebounds, shooting",
-                    "Add 'this season' or 'last season' for specific time periods"
-                ]
-            },
-            "comparisons": {
-                "description": "Compare players head-to-head",
-                "examples": [
-                    "Compare LeBron and Curry",
-                    "Giannis vs Embiid",
-                    "Who's better: Luka or Jokic?",
-                    "LeBron vs Durant stats"
-                ],
-                "tips": [
-                    "Use 'vs', 'versus', or 'compare' for comparisons",
-                    "Compare specific stats: 'LeBron vs Curry shooting'",
-                    "Ask 'who's better' for overall comparisons"
-                ]
-            },
-            "team_info": {
-                "description": "Get team schedules and information",
-                "examples": [
-                    "When do the Warriors play next?",
-                    "Lakers schedule this week",
-                    "Celtics upcoming games",
-                    "Heat next game"
-                ],
-                "tips": [
-                    "Use team names or abbreviations (Warriors, GSW)",
-                    "Ask about 'next game', 'schedule', or 'upcoming'",
-                    "Specify time periods: 'this week', 'next week'"
-                ]
+            "output": result,
+            "direct_processing": True,
+            "parsed_query": {
+                "query_type": QueryType.PLAYER_STATS.value,
+                "entities": entities,
+                "stat_type": stat_val,
+                "season": season
             }
         }
+    
+    def get_query_help(self) -> Mapping[str, Mapping[str, Any]]:
+        """Get help information for different query types"""
+        return _QUERY_HELP
 
 def build_smart_processor() -> SmartQueryProcessor:
     """Create a smart query processor with intelligent routing"""
@@ -6,8 +6,12 @@ Provides natural language query support and improved user experience
 
 import json
 import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from importlib.util import find_spec
+import numpy as np
 from langchain.tools import BaseTool
-from typing import Dict, Optional, List, Any
+from typing import Dict, Optional, List, Any, NamedTuple, Tuple
 from nba_api.stats.endpoints import playercareerstats, commonteamroster, leaguestandings
 from nba_api.stats.endpoints import scoreboardv2, teamgamelog
 from nba_api.stats.static import players, teams
@@ -18,11 +22,211 @@ import datetime
 # Import our modules
 from logger import get_logger, log_performance, log_api_call, log_error_with_context
 from validation import InputValidator, ResponseValidator, ValidationError, safe_validate_input
-from query_parser import query_parser, query_enhancer, ParsedQuery, QueryType, StatType
+from query_parser import parse_cached, query_enhancer, ParsedQuery, QueryType, StatType
+
+try:
+    from rapidfuzz import fuzz, process
+    from rapidfuzz.distance import JaroWinkler
+except ImportError:  # difflib gives the same 0-1 scale, in pure Python
+    fuzz = process = JaroWinkler = None
+    from difflib import SequenceMatcher
+
+try:
+    import orjson
+except ImportError:  # stdlib json is the portable fallback
+    orjson = None
 
 # Initialize logger
 logger = get_logger(__name__)
 
+def _dumps(payload: Any) -> str:
+    """Serialize a tool result; orjson also accepts numpy scalars and arrays"""
+    if orjson is not None:
+        return orjson.dumps(payload, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY).decode()
+    return json.dumps(payload)
+
+# Name-match thresholds on the 0-1 similarity scale
+FULL_NAME_MATCH_THRESHOLD = 0.6
+PARTIAL_NAME_MATCH_THRESHOLD = 0.88  # first or last name alone, scored by Jaro-Winkler
+SUGGESTION_THRESHOLD = 0.3
+
+if fuzz is not None:
+    def _fuzzy_ratio(query: str, target: str) -> float:
+        """Similarity of two strings in [0, 1] (normalized Indel distance)"""
+        return fuzz.ratio(query, target) / 100.0
+else:
+    def _fuzzy_ratio(query: str, target: str) -> float:
+        """Similarity of two strings in [0, 1] (Ratcliff-Obershelp)"""
+        return SequenceMatcher(None, query, target).ratio()
+
+# First and last names are short tokens, where the prefix-weighted Jaro-Winkler
+# similarity separates typos from unrelated names better than the ratio does
+def _jaro_winkler(query, target) -> float:
+    """Jaro-Winkler similarity in [0, 1] (prefix weight 0.1, up to 4 characters).
+    
+    Works on strings or on arrays of code points, which numba can compile.
+    """
+    len_q, len_t = len(query), len(target)
+    if not len_q or not len_t:
+        return 1.0 if len_q == len_t else 0.0
+    
+    # Characters match if equal and no further apart than the window
+    window = max(max(len_q, len_t) // 2 - 1, 0)
+    q_matched = [False] * len_q
+    t_matched = [False] * len_t
+    matches = 0
+    for i, char in enumerate(query):
+        for j in range(max(0, i - window), min(len_t, i + window + 1)):
+            if not t_matched[j] and target[j] == char:
+                q_matched[i] = t_matched[j] = True
+                matches += 1
+                break
+    if not matches:
+        return 0.0
+    
+    # Half the matched characters that appear in a different order
+    transpositions = 0
+    j = 0
+    for i in range(len_q):
+        if q_matched[i]:
+            while not t_matched[j]:
+                j += 1
+            transpositions += query[i] != target[j]
+            j += 1
+    jaro = (matches / len_q + matches / len_t + (matches - transpositions // 2) / matches) / 3
+    
+    if jaro <= 0.7:
+        return jaro
+    prefix = 0
+    for q_char, t_char in zip(query[:4], target[:4]):
+        if q_char != t_char:
+            break
+        prefix += 1
+    return jaro + prefix * 0.1 * (1 - jaro)
+
+def _code_points(text: str) -> np.ndarray:
+    return np.frombuffer(text.encode("utf-32-le"), dtype=np.uint32)
+
+@lru_cache(maxsize=1)
+def _jaro_winkler_batch():
+    """numba batch kernel from name_match_jit, loaded on first use; None without numba"""
+    if find_spec("numba") is None:
+        return None
+    from name_match_jit import jaro_winkler_batch
+    return jaro_winkler_batch
+
+def _ratio_upper_bound(len_a: int, len_b: int) -> float:
+    """Highest ratio two strings of these lengths can reach.
+    
+    Both scorers compute 2 * matches / (len_a + len_b), and no more characters
+    than the shorter string holds can match, so the pure-Python loops skip any
+    candidate whose bound cannot beat the current cut-off.
+    """
+    total = len_a + len_b
+    return 2.0 * min(len_a, len_b) / total if total else 1.0
+
+# The static player and team lists are loaded and lowercased once per process.
+# With rapidfuzz, each fuzzy lookup scores the query against every candidate
+# name in one native cdist call instead of a Python loop of _fuzzy_match calls.
+# Tie-breaking (first candidate in roster order) matches the Python loop.
+
+class _PlayerIndex(NamedTuple):
+    players: List[Dict]
+    full: List[str]
+    first: List[str]
+    last: List[str]
+    parts: List[str]  # first + last, for one cdist call
+    by_name: Dict[str, Dict]  # any lowercased name -> first player in roster order
+
+class _TeamIndex(NamedTuple):
+    teams: List[Dict]
+    full: List[str]
+    by_name: Dict[str, Dict]  # full name, nickname or abbreviation -> team
+
+@lru_cache(maxsize=1)
+def _player_index() -> _PlayerIndex:
+    """Active players with their lowercased names"""
+    active = players.get_active_players()
+    full = [p['full_name'].lower() for p in active]
+    first = [p['first_name'].lower() for p in active]
+    last = [p['last_name'].lower() for p in active]
+    by_name = {}
+    for player, *names in zip(active, full, first, last):
+        for key in names:
+            by_name.setdefault(key, player)
+    return _PlayerIndex(active, full, first, last, first + last, by_name)
+
+@lru_cache(maxsize=1)
+def _team_index() -> _TeamIndex:
+    """All teams with their lowercased names"""
+    all_teams = teams.get_teams()
+    by_name = {}
+    for team in all_teams:
+        for key in (team['full_name'], team['nickname'], team['abbreviation']):
+            by_name.setdefault(key.lower(), team)
+    return _TeamIndex(all_teams, [t['full_name'].lower() for t in all_teams], by_name)
+
+# Per-field cut-offs for full, first and last name
+_PLAYER_FIELD_CUTOFFS = np.array([
+    FULL_NAME_MATCH_THRESHOLD, PARTIAL_NAME_MATCH_THRESHOLD, PARTIAL_NAME_MATCH_THRESHOLD
+])
+
+@lru_cache(maxsize=1)
+def _encoded_parts() -> Tuple[np.ndarray, np.ndarray]:
+    """Code points of every first then last name, concatenated, and each name's offsets"""
+    parts = _player_index().parts
+    offsets = np.zeros(len(parts) + 1, dtype=np.int64)
+    np.cumsum([len(part) for part in parts], out=offsets[1:])
+    return _code_points("".join(parts)), offsets
+
+def _part_scores(query: str) -> List[List[float]]:
+    """Jaro-Winkler of query against every first name, then every last name"""
+    index = _player_index()
+    batch = _jaro_winkler_batch()
+    if batch is not None:
+        codes, offsets = _encoded_parts()
+        scores = np.empty(len(index.parts))
+        batch(_code_points(query), codes, offsets, scores)
+    else:
+        scores = np.array([_jaro_winkler(query, part) for part in index.parts])
+    return scores.reshape(2, len(index.players)).tolist()
+
+def _ratios(query: str, choices: List[str]) -> np.ndarray:
+    """fuzz.ratio of query against every choice, on the 0-100 scale"""
+    return process.cdist([query], choices, scorer=fuzz.ratio, dtype=np.float64)[0]
+
+def _best_player_match(name: str) -> Optional[Dict]:
+    """Vectorized fuzzy fallback of EnhancedStatsTool._find_player_by_name"""
+    index = _player_index()
+    full = _ratios(name, index.full) / 100.0
+    parts = process.cdist(
+        [name], index.parts, scorer=JaroWinkler.normalized_similarity, dtype=np.float64
+    )[0].reshape(2, len(index.players))
+    # One row per player, columns full/first/last, zeroed below each cut-off
+    scores = np.column_stack((full, parts[0], parts[1]))
+    scores = np.where(scores > _PLAYER_FIELD_CUTOFFS, scores, 0.0).ravel()
+    best = int(np.argmax(scores))
+    return index.players[best // 3] if scores[best] > 0 else None
+
+def _best_team_match(name: str) -> Optional[Dict]:
+    """Vectorized fuzzy fallback of EnhancedScheduleTool._find_team_by_name"""
+    index = _team_index()
+    scores = _ratios(name, index.full)
+    best = int(np.argmax(scores))
+    return index.teams[best] if scores[best] > FULL_NAME_MATCH_THRESHOLD * 100 else None
+
+# Smallest float above the suggestion threshold, as an inclusive score_cutoff
+_SUGGESTION_CUTOFF = float(np.nextafter(SUGGESTION_THRESHOLD * 100, 100.0))
+
+def _first_matches(name: str, entries: List[Dict], names: List[str], limit: int = 5) -> List[str]:
+    """Full names of the first `limit` entries scoring above the suggestion threshold"""
+    # Only pass/fail matters here, so scores come back as uint8 and anything
+    # under the cut-off as 0; a passing score rounds to at least 30
+    passed = process.cdist([name], names, scorer=fuzz.ratio,
+                           score_cutoff=_SUGGESTION_CUTOFF, dtype=np.uint8)[0]
+    hits = np.flatnonzero(passed)
+    return [entries[i]['full_name'] for i in hits[:limit]]
+
 class EnhancedStatsTool(BaseTool):
     name: str = "enhanced_nba_stats"
     description: str = (
@@ -36,7 +240,7 @@ class EnhancedStatsTool(BaseTool):
         
         try:
             # Parse the natural language query
-            parsed = query_parser.parse(query)
+            parsed = parse_cached(query.strip().lower())
             logger.info(f"Parsed query: {parsed}")
             
             # Handle different query types
@@ -45,18 +249,37 @@ class EnhancedStatsTool(BaseTool):
             elif parsed.query_type == QueryType.PLAYER_COMPARISON:
                 return self._handle_player_comparison(parsed)
             else:
-                return json.dumps({"error": f"Unsupported query type: {parsed.query_type}"})
+                return _dumps({"error": f"Unsupported query type: {parsed.query_type}"})
                 
         except Exception as e:
             log_error_with_context(logger, e, {"query": query})
-            return json.dumps({"error": f"Error processing query: {str(e)}"})
+            return _dumps({"error": f"Error processing query: {str(e)}"})
+        finally:
+            log_performance(logger, "enhanced_stats_tool", time.time() - start_time)
+
+    def _run_structured(self, entity: str, stat_type: str, season: Optional[str]) -> str:
+        """Player stats for fields the caller has already parsed, skipping the text round trip"""
+        start_time = time.time()
+        
+        try:
+            parsed = ParsedQuery(
+                query_type=QueryType.PLAYER_STATS,
+                entities=[entity],
+                stat_type=StatType(stat_type),
+                season=season
+            )
+            return self._handle_player_stats(parsed)
+            
+        except Exception as e:
+            log_error_with_context(logger, e, {"entity": entity, "stat_type": stat_type, "season": season})
+            return _dumps({"error": f"Error processing query: {str(e)}"})
         finally:
             log_performance(logger, "enhanced_stats_tool", time.time() - start_time)
 
     def _handle_player_stats(self, parsed: ParsedQuery) -> str:
         """Handle player statistics queries"""
         if not parsed.entities:
-            return json.dumps({"error": "No player name found in query"})
+            return _dumps({"error": "No player name found in query"})
         
         player_name = parsed.entities[0]
         player_info = self._find_player_by_name(player_name)
@@ -64,7 +287,7 @@ class EnhancedStatsTool(BaseTool):
         if not player_info:
             # Try fuzzy matching
             suggestions = self._suggest_similar_players(player_name)
-            return json.dumps({
+            return _dumps({
                 "error": f"Player '{player_name}' not found",
                 "suggestions": suggestions
             })
@@ -78,12 +301,12 @@ class EnhancedStatsTool(BaseTool):
         # Format response based on context
         response = self._format_player_response(player_info, filtered_stats, parsed)
         
-        return json.dumps(response)
+        return _dumps(response)
 
     def _handle_player_comparison(self, parsed: ParsedQuery) -> str:
         """Handle player comparison queries"""
         if len(parsed.entities) < 2:
-            return json.dumps({"error": "Need at least two players for comparison"})
+            return _dumps({"error": "Need at least two players for comparison"})
         
         player1_name = parsed.entities[0]
         player2_name = parsed.entities[1]
@@ -92,65 +315,81 @@ class EnhancedStatsTool(BaseTool):
         player2_info = self._find_player_by_name(player2_name)
         
         if not player1_info or not player2_info:
-            return json.dumps({"error": "One or both players not found"})
+            return _dumps({"error": "One or both players not found"})
         
-        # Get stats for both players
-        stats1 = self._get_player_stats(player1_info, parsed.season)
-        stats2 = self._get_player_stats(player2_info, parsed.season)
+        # Get stats for both players; on a cache miss each is a separate API
+        # round trip, so fetch them side by side
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            future1 = executor.submit(self._get_player_stats, player1_info, parsed.season)
+            future2 = executor.submit(self._get_player_stats, player2_info, parsed.season)
+            stats1, stats2 = future1.result(), future2.result()
         
         # Compare stats
         comparison = self._compare_player_stats(player1_info, stats1, player2_info, stats2, parsed.stat_type)
         
-        return json.dumps(comparison)
+        return _dumps(comparison)
 
     def _find_player_by_name(self, name: str) -> Dict | None:
         """Find player by name with enhanced fuzzy matching"""
         name = name.strip()
+        name_lc = name.lower()
+        index = _player_index()
         
-        # Try exact match first
+        # Exact full, first or last name of an active player
+        player = index.by_name.get(name_lc)
+        if player is not None:
+            return player
+        
+        # Then nba_api's full-name search (substring, accent-insensitive)
         exact_match = players.find_players_by_full_name(name)
         if exact_match and exact_match[0]['is_active']:
             return exact_match[0]
         
         # Try partial matches with fuzzy matching
-        all_players = players.get_active_players()
+        if process is not None:
+            return _best_player_match(name_lc)
+        
         best_match = None
         best_score = 0
+        query_len = len(name_lc)
+        
+        first_scores, last_scores = _part_scores(name_lc)
         
-        for player in all_players:
+        for player, full, first_score, last_score in zip(index.players, index.full, first_scores, last_scores):
             # Check full name
-            score = self._fuzzy_match(name.lower(), player['full_name'].lower())
-            if score > best_score and score > 0.6:  # Threshold for good match
-                best_score = score
-                best_match = player
+            if _ratio_upper_bound(query_len, len(full)) > max(FULL_NAME_MATCH_THRESHOLD, best_score):
+                score = self._fuzzy_match(name_lc, full)
+                if score > best_score and score > FULL_NAME_MATCH_THRESHOLD:
+                    best_score = score
+                    best_match = player
             
-            # Check first name
-            score = self._fuzzy_match(name.lower(), player['first_name'].lower())
-            if score > best_score and score > 0.8:
-                best_score = score
-                best_match = player
-            
-            # Check last name
-            score = self._fuzzy_match(name.lower(), player['last_name'].lower())
-            if score > best_score and score > 0.8:
-                best_score = score
-                best_match = player
+            # Check first and last name
+            for score in (first_score, last_score):
+                if score > best_score and score > PARTIAL_NAME_MATCH_THRESHOLD:
+                    best_score = score
+                    best_match = player
         
         return best_match
 
     def _fuzzy_match(self, query: str, target: str) -> float:
         """Calculate fuzzy match score between query and target"""
-        from difflib import SequenceMatcher
-        return SequenceMatcher(None, query, target).ratio()
+        return _fuzzy_ratio(query, target)
 
     def _suggest_similar_players(self, name: str) -> List[str]:
         """Suggest similar player names"""
-        all_players = players.get_active_players()
+        name_lc = name.lower()
+        index = _player_index()
+        if process is not None:
+            return _first_matches(name_lc, index.players, index.full)
+        
         suggestions = []
         
-        for player in all_players:
-            score = self._fuzzy_match(name.lower(), player['full_name'].lower())
-            if score > 0.3:  # Lower threshold for suggestions
+        query_len = len(name_lc)
+        for player, full in zip(index.players, index.full):
+            if _ratio_upper_bound(query_len, len(full)) <= SUGGESTION_THRESHOLD:
+                continue
+            score = self._fuzzy_match(name_lc, full)
+            if score > SUGGESTION_THRESHOLD:
                 suggestions.append(player['full_name'])
         
         return suggestions[:5]  # Return top 5 suggestions
@@ -158,7 +397,9 @@ class EnhancedStatsTool(BaseTool):
     def _get_player_stats(self, player_info: Dict, season: str) -> Dict:
         """Get player statistics with caching"""
         player_id = player_info['id']
-        cache_key = f"enhanced_stats_{player_id}_{season}"
+        # Scoped by month so in-season totals are refreshed at least monthly
+        month = datetime.date.today().strftime("%Y-%m")
+        cache_key = f"enhanced_stats_{player_id}_{season}_{month}"
         
         # Check cache first
         cached_data = cache_get(cache_key)
@@ -169,42 +410,51 @@ class EnhancedStatsTool(BaseTool):
         try:
             api_start = time.time()
             
-            # Get career stats
+            # Get career stats; only the regular-season totals are used, so
+            # build that one DataFrame rather than one per result set
             career_stats = playercareerstats.PlayerCareerStats(player_id=player_id)
-            df = career_stats.get_data_frames()[0]
+            df = career_stats.season_totals_regular_season.get_data_frame()
             
             api_duration = time.time() - api_start
             log_api_call(logger, "playercareerstats", "GET", 200, api_duration, 
                         player_id=player_id)
             
-            # Find current season data
-            current_season_data = df[df['SEASON_ID'].str.contains(season, na=False)]
-            if current_season_data.empty:
-                current_season_data = df.iloc[[-1]]
-            
-            if current_season_data.empty:
+            if df.empty:
                 raise ValueError(f"No stats found for {player_info['full_name']}")
             
-            season_stats = current_season_data.iloc[0]
+            # First row of the requested season (a plain substring match, so a
+            # bare year like "2024" still works), else the most recent season
+            in_season = np.flatnonzero(df['SEASON_ID'].str.contains(season, regex=False, na=False).to_numpy())
+            # Plain dict of Python scalars, so the arithmetic below skips
+            # pandas label lookups and boxing
+            season_stats = df.iloc[in_season[0] if in_season.size else -1].to_dict()
             
             # Calculate per-game averages
             games_played = season_stats.get('GP', 1)
             if games_played == 0:
                 games_played = 1
             
+            pts = season_stats.get('PTS', 0)
+            ast = season_stats.get('AST', 0)
+            reb = season_stats.get('REB', 0)
+            # Missing (None) and NaN shooting percentages both become 0.0
+            fg_pct, fg3_pct, ft_pct = (np.nan_to_num(np.array([
+                season_stats.get('FG_PCT'), season_stats.get('FG3_PCT'), season_stats.get('FT_PCT')
+            ], dtype=np.float64)) * 100).tolist()
+            
             stats = {
-                "ppg": round(season_stats.get('PTS', 0) / games_played, 1),
-                "apg": round(season_stats.get('AST', 0) / games_played, 1),
-                "rpg": round(season_stats.get('REB', 0) / games_played, 1),
+                "ppg": round(pts / games_played, 1),
+                "apg": round(ast / games_played, 1),
+                "rpg": round(reb / games_played, 1),
                 "spg": round(season_stats.get('STL', 0) / games_played, 1),
                 "bpg": round(season_stats.get('BLK', 0) / games_played, 1),
-                "fg_pct": round(season_stats.get('FG_PCT', 0) * 100, 1) if season_stats.get('FG_PCT') else 0,
-                "fg3_pct": round(season_stats.get('FG3_PCT', 0) * 100, 1) if season_stats.get('FG3_PCT') else 0,
-                "ft_pct": round(season_stats.get('FT_PCT', 0) * 100, 1) if season_stats.get('FT_PCT') else 0,
+                "fg_pct": round(fg_pct, 1),
+                "fg3_pct": round(fg3_pct, 1),
+                "ft_pct": round(ft_pct, 1),
                 "games_played": int(games_played),
-                "total_points": int(season_stats.get('PTS', 0)),
-                "total_assists": int(season_stats.get('AST', 0)),
-                "total_rebounds": int(season_stats.get('REB', 0))
+                "total_points": int(pts),
+                "total_assists": int(ast),
+                "total_rebounds": int(reb)
             }
             
             # Cache the results
@@ -313,6 +563,16 @@ class EnhancedStatsTool(BaseTool):
         
         return comparison
 
+# Scoreboard column -> (schedule field, value used when the column is missing)
+_SCHEDULE_COLUMNS = {
+    'GAME_DATE_EST': ("date", 'Unknown'),
+    'TEAM_NAME_HOME': ("home_team", 'Unknown'),
+    'TEAM_NAME_AWAY': ("away_team", 'Unknown'),
+    'PTS_HOME': ("home_score", 0),
+    'PTS_AWAY': ("away_score", 0),
+    'GAME_STATUS_TEXT': ("status", 'Unknown'),
+}
+
 class EnhancedScheduleTool(BaseTool):
     name: str = "enhanced_nba_schedule"
     description: str = (
@@ -325,53 +585,65 @@ class EnhancedScheduleTool(BaseTool):
         start_time = time.time()
         
         try:
+            # A repeated question is answered from cache before any parsing
+            query_norm = query.strip().lower()
+            query_key = f"schedule_query_{datetime.date.today().isoformat()}_{query_norm}"
+            cached_data = cache_get(query_key)
+            if cached_data:
+                return _dumps(cached_data)
+            
             # Parse the natural language query
-            parsed = query_parser.parse(query)
+            parsed = parse_cached(query_norm)
             logger.info(f"Parsed schedule query: {parsed}")
             
             if not parsed.entities:
-                return json.dumps({"error": "No team name found in query"})
+                return _dumps({"error": "No team name found in query"})
             
             team_name = parsed.entities[0]
             team_info = self._find_team_by_name(team_name)
             
             if not team_info:
                 suggestions = self._suggest_similar_teams(team_name)
-                return json.dumps({
+                return _dumps({
                     "error": f"Team '{team_name}' not found",
                     "suggestions": suggestions
                 })
             
             # Get team schedule
             schedule = self._get_team_schedule(team_info, parsed.context)
+            cache_set(query_key, schedule)
             
-            return json.dumps(schedule)
+            return _dumps(schedule)
             
         except Exception as e:
             log_error_with_context(logger, e, {"query": query})
-            return json.dumps({"error": f"Error processing schedule query: {str(e)}"})
+            return _dumps({"error": f"Error processing schedule query: {str(e)}"})
         finally:
             log_performance(logger, "enhanced_schedule_tool", time.time() - start_time)
 
     def _find_team_by_name(self, name: str) -> Dict | None:
         """Find team by name with fuzzy matching"""
         name = name.strip().lower()
-        all_teams = teams.get_teams()
+        index = _team_index()
         
         # Try exact match first
-        for team in all_teams:
-            if (name == team['full_name'].lower() or 
-                name == team['nickname'].lower() or
-                name == team['abbreviation'].lower()):
-                return team
+        team = index.by_name.get(name)
+        if team is not None:
+            return team
         
         # Try fuzzy matching
+        if process is not None:
+            return _best_team_match(name)
+        
         best_match = None
         best_score = 0
+        query_len = len(name)
         
-        for team in all_teams:
-            score = self._fuzzy_match(name, team['full_name'].lower())
-            if score > best_score and score > 0.6:
+        for team, full in zip(index.teams, index.full):
+            if _ratio_upper_bound(query_len, len(full)) <= max(FULL_NAME_MATCH_THRESHOLD, best_score):
+                continue
+            score = self._fuzzy_match(name, full)
+            if score > best_score and score > FULL_NAME_MATCH_THRESHOLD:
                 best_score = score
                 best_match = team
         
@@ -379,17 +651,23 @@ class EnhancedScheduleTool(BaseTool):
 
     def _fuzzy_match(self, query: str, target: str) -> float:
         """Calculate fuzzy match score"""
-        from difflib import SequenceMatcher
-        return SequenceMatcher(None, query, target).ratio()
+        return _fuzzy_ratio(query, target)
 
     def _suggest_similar_teams(self, name: str) -> List[str]:
         """Suggest similar team names"""
-        all_teams = teams.get_teams()
+        name_lc = name.lower()
+        index = _team_index()
+        if process is not None:
+            return _first_matches(name_lc, index.teams, index.full)
+        
         suggestions = []
         
-        for team in all_teams:
-            score = self._fuzzy_match(name.lower(), team['full_name'].lower())
-            if score > 0.3:
+        query_len = len(name_lc)
+        for team, full in zip(index.teams, index.full):
+            if _ratio_upper_bound(query_len, len(full)) <= SUGGESTION_THRESHOLD:
+                continue
+            score = self._fuzzy_match(name_lc, full)
+            if score > SUGGESTION_THRESHOLD:
                 suggestions.append(team['full_name'])
         
         return suggestions[:5]
@@ -397,7 +675,9 @@ class EnhancedScheduleTool(BaseTool):
     def _get_team_schedule(self, team_info: Dict, context: Dict) -> Dict:
         """Get team schedule with context awareness"""
         team_id = team_info['id']
-        cache_key = f"schedule_{team_id}_enhanced"
+        # ScoreboardV2 returns today's games, so yesterday's entry must not be reused
+        today = datetime.date.today().isoformat()
+        cache_key = f"schedule_{team_id}_enhanced_{today}"
         
         # Check cache first
         cached_data = cache_get(cache_key)
@@ -415,24 +695,18 @@ class EnhancedScheduleTool(BaseTool):
                 (games['TEAM_ABBREVIATION_H'] == team_info['abbreviation'])
             ]
             
-            # Format schedule
+            # Format schedule: select and rename the columns once, fill any the
+            # feed lacks with their default, then emit every row in one call
+            present = {col: key for col, (key, _) in _SCHEDULE_COLUMNS.items() if col in team_games.columns}
+            games_out = team_games[list(present)].rename(columns=present).assign(**{
+                key: default for col, (key, default) in _SCHEDULE_COLUMNS.items() if col not in present
+            })
             schedule = {
                 "team": team_info['full_name'],
                 "abbreviation": team_info['abbreviation'],
-                "upcoming_games": []
+                "upcoming_games": games_out[[key for key, _ in _SCHEDULE_COLUMNS.values()]].to_dict(orient="records")
             }
             
-            for _, game in team_games.iterrows():
-                game_info = {
-                    "date": game.get('GAME_DATE_EST', 'Unknown'),
-                    "home_team": game.get('TEAM_NAME_HOME', 'Unknown'),
-                    "away_team": game.get('TEAM_NAME_AWAY', 'Unknown'),
-                    "home_score": game.get('PTS_HOME', 0),
-                    "away_score": game.get('PTS_AWAY', 0),
-                    "status": game.get('GAME_STATUS_TEXT', 'Unknown')
-                }
-                schedule["upcoming_games"].append(game_info)
-            
             # Cache the results
             cache_set(cache_key, schedule)
             
@@ -0,0 +1,18 @@
+#!/usr/bin/env python3
+"""
+numba-compiled name scoring for enhanced_tools
+Only imported on the first fuzzy player lookup without rapidfuzz, so numba
+is neither imported nor compiled at startup; compiled code is cached on disk
+"""
+
+from numba import njit, prange
+
+from enhanced_tools import _jaro_winkler
+
+_jaro_winkler_jit = njit(cache=True)(_jaro_winkler)
+
+@njit(parallel=True, cache=True)
+def jaro_winkler_batch(query, codes, offsets, out):
+    """Score query against each name codes[offsets[k]:offsets[k + 1]] into out[k]"""
+    for k in prange(out.shape[0]):
+        out[k] = _jaro_winkler_jit(query, codes[offsets[k]:offsets[k + 1]])
@@ -7,9 +7,9 @@ Provides flexible, natural language query parsing with context awareness
 import re
 import json
 from typing import Dict, List, Optional, Tuple, Any
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
+from functools import lru_cache
 from enum import Enum
-from difflib import SequenceMatcher
 import logging
 
 logger = logging.getLogger(__name__)
@@ -42,11 +42,15 @@ class ParsedQuery:
     season: Optional[str] = None
     comparison: bool = False
     context: Dict[str, Any] = None
+    is_simple: bool = False  # Answerable by a direct tool call, set by parse()
     
     def __post_init__(self):
         if self.context is None:
             self.context = {}
 
+# Query types SmartQueryProcessor can answer without the agent
+_SIMPLE_TYPES = frozenset({QueryType.PLAYER_STATS, QueryType.TEAM_SCHEDULE})
+
 class FlexibleQueryParser:
     """Advanced query parser with natural language understanding"""
     
@@ -133,6 +137,14 @@ class FlexibleQueryParser:
         # Extract additional context
         parsed.context = self._extract_context(query)
         
+        # Simple queries have clear entities and specific stat types
+        parsed.is_simple = (
+            len(parsed.entities) == 1 and
+            parsed.query_type in _SIMPLE_TYPES and
+            parsed.stat_type != "all" and
+            not parsed.comparison
+        )
+        
         logger.debug(f"Parsed query: {parsed}")
         return parsed
     
@@ -310,4 +322,18 @@ class QueryEnhancer:
 
 # Global parser instance
 query_parser = FlexibleQueryParser()
-query_enhancer = QueryEnhancer() 
\ No newline at end of file
+query_enhancer = QueryEnhancer() 
+
+@lru_cache(maxsize=4096)
+def _parse_shared(query_norm: str) -> ParsedQuery:
+    return query_parser.parse(query_norm)
+
+def parse_cached(query_norm: str) -> ParsedQuery:
+    """Parse a stripped, lowercased query once per process (bounded LRU).
+    
+    parse() lowercases and strips its input itself, so the normalized key
+    yields the same result. Each call returns its own copy with fresh
+    entities and context containers, so callers may modify it freely.
+    """
+    parsed = _parse_shared(query_norm)
+    return replace(parsed, entities=list(parsed.entities), context=dict(parsed.context))
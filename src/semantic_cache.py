@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Response cache for the enhanced agent
+Serves repeated questions without another agent run: exact matches on the
+normalized query text first, then near-duplicate phrasings by embedding
+similarity when sentence-transformers is installed
+"""
+
+import re
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Any, Dict, Optional
+
+import numpy as np
+
+try:
+    from sentence_transformers import SentenceTransformer
+except ImportError:  # the exact-match tier works on its own
+    SentenceTransformer = None
+
+from logger import get_logger
+
+logger = get_logger(__name__)
+
+_WHITESPACE_RE = re.compile(r"\s+")
+
+def normalize_query(query: str) -> str:
+    """Lowercase the query and collapse runs of whitespace"""
+    return _WHITESPACE_RE.sub(" ", query.strip().lower())
+
+class SemanticCache:
+    """Bounded two-tier cache of agent responses keyed by the user's query"""
+
+    def __init__(self, max_entries: int = 1024, similarity_threshold: float = 0.9,
+                 model_name: str = "sentence-transformers/all-MiniLM-L6-v2"):
+        self.max_entries = max_entries
+        self.similarity_threshold = similarity_threshold
+        self.model_name = model_name
+
+        # Tier 1: normalized query text -> response, least-recently-used first
+        self._exact = OrderedDict()
+        self._lock = threading.Lock()
+
+        # Tier 2: unit-length embeddings in a ring buffer, one row per response
+        self._semantic_enabled = SentenceTransformer is not None
+        self._model = None
+        self._vectors = None
+        self._responses = [None] * max_entries
+        self._count = 0
+        self._next_row = 0
+        # get() and set() on the same miss share one encoding
+        self._embed = lru_cache(maxsize=256)(self._encode)
+
+        self.stats = {"exact_hits": 0, "semantic_hits": 0, "misses": 0}
+
+    def _encode(self, text: str) -> Optional[np.ndarray]:
+        if self._model is None:
+            try:
+                self._model = SentenceTransformer(self.model_name)
+            except Exception as e:
+                logger.warning(f"Semantic cache disabled, could not load {self.model_name}: {e}")
+                self._semantic_enabled = False
+                return None
+        return self._model.encode(text, normalize_embeddings=True).astype(np.float32)
+
+    def get(self, query: str) -> Optional[Dict[str, Any]]:
+        """Return a copy of the cached response for this query, or None"""
+        key = normalize_query(query)
+        with self._lock:
+            if key in self._exact:
+                self._exact.move_to_end(key)
+                self.stats["exact_hits"] += 1
+                return dict(self._exact[key])
+
+        if self._semantic_enabled and self._count:
+            vector = self._embed(key)
+            if vector is not None:
+                with self._lock:
+                    # Rows are unit length, so one matmul gives every cosine similarity
+                    scores = self._vectors[:self._count] @ vector
+                    best = int(np.argmax(scores))
+                    if scores[best] >= self.similarity_threshold:
+                        self.stats["semantic_hits"] += 1
+                        return dict(self._responses[best])
+
+        with self._lock:
+            self.stats["misses"] += 1
+        return None
+
+    def set(self, query: str, response: Dict[str, Any]) -> None:
+        """Cache a response under this query"""
+        key = normalize_query(query)
+        response = dict(response)
+        with self._lock:
+            self._exact[key] = response
+            self._exact.move_to_end(key)
+            while len(self._exact) > self.max_entries:
+                self._exact.popitem(last=False)
+
+        if not self._semantic_enabled:
+            return
+        vector = self._embed(key)
+        if vector is None:
+            return
+        with self._lock:
+            if self._vectors is None:
+                self._vectors = np.empty((self.max_entries, vector.shape[0]), dtype=np.float32)
+            # Once full, the oldest row is overwritten
+            row = self._next_row
+            self._vectors[row] = vector
+            self._responses[row] = response
+            self._next_row = (row + 1) % self.max_entries
+            self._count = min(self._count + 1, self.max_entries)
+
+    def clear(self) -> None:
+        """Drop every cached response"""
+        with self._lock:
+            self._exact.clear()
+            self._responses = [None] * self.max_entries
+            self._count = 0
+            self._next_row = 0
@@ -3,9 +3,9 @@ NBA Agent Performance & Monitoring Tests using Judgment Labs
 Tests response times, accuracy benchmarks, and production monitoring
 """
 
+import asyncio
 import time
 import statistics
-from concurrent.futures import ThreadPoolExecutor, as_completed
 from judgeval import JudgmentClient
 from judgeval.data import Example
 from judgeval.scorers import (
@@ -15,7 +15,7 @@ from judgeval.scorers import (
     HallucinationScorer
 )
 from judgeval.tracer import Tracer
-from agent import build_agent
+from agent import abatch_invoke, build_agent
 
 class SimpleLatencyScorer:
     """Simple latency scorer since LatencyScorer is not available"""
@@ -131,41 +131,26 @@ class TestNBAAgentPerformance:
             "What are Kevin Durant's stats?"
         ] * 3  # 24 total queries
         
-        def execute_query(query):
-            """Execute a single query and measure performance"""
-            start_time = time.time()
-            
-            try:
-                response = self.agent.invoke({"input": query})
-                result = response.get("output", str(response))
-                success = True
-                error = None
-            except Exception as e:
-                result = f"Error: {str(e)}"
-                success = False
-                error = str(e)
-            
-            end_time = time.time()
-            
-            return {
-                "query": query,
-                "result": result,
-                "time": end_time - start_time,
-                "success": success,
-                "error": error
-            }
-        
-        # Execute queries concurrently
+        # Execute queries concurrently on one event loop
         print(f"  🔄 Executing {len(concurrent_queries)} concurrent queries...")
         
         start_time = time.time()
         
-        with ThreadPoolExecutor(max_workers=5) as executor:
-            futures = [executor.submit(execute_query, query) for query in concurrent_queries]
-            results = [future.result() for future in as_completed(futures)]
+        outcomes = asyncio.run(abatch_invoke(self.agent, concurrent_queries, max_concurrency=5))
         
         total_time = time.time() - start_time
         
+        results = []
+        for query, (result, elapsed) in zip(concurrent_queries, outcomes):
+            success = not isinstance(result, Exception)
+            results.append({
+                "query": query,
+                "result": result if success else f"Error: {result}",
+                "time": elapsed,
+                "success": success,
+                "error": None if success else str(result)
+            })
+        
         # Analyze results
         successful_queries = [r for r in results if r["success"]]
         failed_queries = [r for r in results if not r["success"]]
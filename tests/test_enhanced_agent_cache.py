@@ -0,0 +1,73 @@
+import asyncio
+import os
+import sys
+from types import SimpleNamespace
+
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(__file__)), "src"))
+
+from enhanced_agent import EnhancedNBAAgent
+
+
+class StubExecutor:
+    """Stands in for a LangChain AgentExecutor, optionally saving turns to memory"""
+
+    def __init__(self, memory=None):
+        self.memory = memory
+        self.inputs = []
+
+    def invoke(self, inputs):
+        self.inputs.append(inputs["input"])
+        output = f"answer {len(self.inputs)} to {inputs['input']}"
+        if self.memory is not None:
+            self.memory.save_context(inputs, {"output": output})
+        return {"output": output}
+
+    async def ainvoke(self, inputs):
+        return self.invoke(inputs)
+
+
+def make_agent():
+    messages = []
+    memory = SimpleNamespace(
+        chat_memory=SimpleNamespace(messages=messages),
+        save_context=lambda inputs, outputs: messages.extend([inputs["input"], outputs["output"]]),
+    )
+    agent = EnhancedNBAAgent()
+    agent._memory = memory
+    agent._agent = StubExecutor(memory)
+    agent._stateless_agent = StubExecutor()
+    return agent, messages
+
+
+def test_repeated_query_is_served_from_cache_once_memory_is_filled():
+    agent, messages = make_agent()
+
+    first = agent.invoke({"input": "LeBron James stats"})
+    assert agent._stateless_agent.inputs == ["LeBron James stats"]
+    assert messages == ["LeBron James stats", first["output"]]
+
+    second = agent.invoke({"input": "LeBron James stats"})
+    assert second == first
+    assert agent._stateless_agent.inputs == ["LeBron James stats"]
+    # The cached turn is still part of the conversation
+    assert messages[-2:] == ["LeBron James stats", first["output"]]
+    assert agent.response_cache.stats["exact_hits"] == 1
+
+
+def test_follow_up_uses_memory_and_is_not_cached():
+    agent, messages = make_agent()
+    agent.invoke({"input": "LeBron James stats"})
+
+    agent.invoke({"input": "what about his assists?"})
+    agent.invoke({"input": "what about his assists?"})
+    assert agent._agent.inputs == ["what about his assists?"] * 2
+    assert agent._stateless_agent.inputs == ["LeBron James stats"]
+    assert len(messages) == 6
+
+
+def test_async_invoke_shares_the_cache():
+    agent, _ = make_agent()
+    first = asyncio.run(agent.ainvoke({"input": "Warriors schedule"}))
+    second = asyncio.run(agent.ainvoke({"input": "warriors   SCHEDULE"}))
+    assert second == first
+    assert agent._stateless_agent.inputs == ["Warriors schedule"]
@@ -0,0 +1,48 @@
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(__file__)), "archive"))
+
+import pytest
+
+import _fuzzy
+from _fuzzy import encode_names, top_k
+
+pytest.importorskip("streamlit")
+from smart_interface import SmartInterface
+
+
+TEAMS = encode_names(["Lakers", "76ers", "Trail Blazers", "Warriors"])
+
+
+def test_partial_input_completes_any_word():
+    assert top_k("blaz", TEAMS, 5, 1) == ["Trail Blazers"]
+    assert top_k("lakr", TEAMS, 5, 1) == ["Lakers"]
+    assert top_k("ers", TEAMS, 5, 1)[:2] == ["Lakers", "76ers"]
+
+
+def test_whole_word_typos_still_match():
+    assert top_k("lakrs", TEAMS, 5, 1) == ["Lakers"]
+    assert top_k("xyz", TEAMS, 5, 1) == []
+
+
+def test_kernels_agree_on_prefix_distance():
+    for query, text, max_dist in [("lakr", "lakers", 1), ("lakrs", "lakers", 1),
+                                  ("blaz", "trail blazers", 1), ("xyz", "lakers", 1)]:
+        expected = _fuzzy._bounded_levenshtein(query, text, max_dist)
+        assert _fuzzy._myers_distance(_fuzzy._myers_pattern(query), text, max_dist) == expected
+
+
+@pytest.mark.parametrize("partial, team", [
+    ("blaz", "Trail Blazers"),
+    ("lakr", "Lakers"),
+    ("ers", "76ers"),
+    ("lakrs", "Lakers"),
+])
+def test_suggest_teams_completes_partial_names(partial, team):
+    assert team in SmartInterface.suggest_teams(partial)
+
+
+def test_suggest_players_completes_partial_names():
+    assert "Stephen Curry" in SmartInterface.suggest_players("curr")
+    assert "Giannis Antetokounmpo" in SmartInterface.suggest_players("gianis")
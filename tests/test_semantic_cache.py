@@ -0,0 +1,29 @@
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(__file__)), "src"))
+
+from semantic_cache import SemanticCache, normalize_query
+
+
+def test_exact_tier_matches_normalized_query():
+    cache = SemanticCache(max_entries=4)
+    assert cache.get("LeBron stats") is None
+
+    cache.set("LeBron stats", {"output": "27.1 ppg"})
+    assert normalize_query("  lebron   STATS ") == "lebron stats"
+    assert cache.get("  lebron   STATS ") == {"output": "27.1 ppg"}
+    assert cache.stats["exact_hits"] == 1
+    assert cache.stats["misses"] == 1
+
+
+def test_cached_responses_are_copies_and_bounded():
+    cache = SemanticCache(max_entries=2)
+    cache.set("a", {"output": "a"})
+    cache.get("a")["output"] = "changed"
+    assert cache.get("a") == {"output": "a"}
+
+    cache.set("b", {"output": "b"})
+    cache.set("c", {"output": "c"})
+    assert cache.get("a") is None
+    assert cache.get("c") == {"output": "c"}
@@ -38,7 +38,7 @@ from tools import (
     _lookup_id,
     _lookup_team_id,
 )
-from cache import _path_for_key, _memory_cache
+from cache import _path_for_key, _memory_cache, flush
 
 
 def test_stats_tool_uses_fixture_and_cache(tmp_path, monkeypatch):
@@ -51,11 +51,13 @@ def test_stats_tool_uses_fixture_and_cache(tmp_path, monkeypatch):
     result = json.loads(tool._run('LeBron 2024-25'))
     assert result['player'] == 'Lebron'
     assert 'ppg' in result['stats']
+    flush()
     assert cache_file.exists()
     mtime = cache_file.stat().st_mtime
 
     # second call should read from cache and not modify file
     result2 = json.loads(tool._run('LeBron 2024-25'))
+    flush()
     assert cache_file.stat().st_mtime == mtime
     assert result2 == result
 
@@ -78,6 +80,7 @@ def test_roster_tool():
     data = json.loads(tool._run('Warriors'))
     assert data['team'].startswith('Warriors') or data['team'].startswith('Golden')
     assert any('Curry' in p for p in data['roster'])
+    flush()
     assert cache_file.exists()
 
 
@@ -93,6 +96,7 @@ def test_arena_tool():
     data = json.loads(tool._run('Warriors'))
     assert data['team'].startswith('Golden')
     assert 'arena' in data
+    flush()
     assert cache_file.exists()
 
 def test_standings_tool():